@@ -3,26 +3,22 @@ API Weaver - Main Application
 Automated API Generator for Web & Mobile Applications
 """
 
-from flask import Flask, request, jsonify
+from flask import (Flask, request, jsonify, send_file, send_from_directory,
+                   Response, stream_with_context)
 from flask_cors import CORS
-from flask_jwt_extended import JWTManager, jwt_required
-from flask_sqlalchemy import SQLAlchemy
+from flask_jwt_extended import JWTManager
 from flask_migrate import Migrate
 from flasgger import Swagger
 import os
-from datetime import timedelta, datetime
+import time
+from datetime import timedelta
 
 # Import modules
-# Change this line
 from models.user import User, db
-
-# To these lines
-from models.user import db
-from models.user import User
-from connectors.mysql_connector import MySQLConnector
-from connectors.mongodb_connector import MongoDBConnector
+from connectors.registry import ConnectorRegistry
 from generators.api_generator import APIGenerator
 from auth.auth_manager import AuthManager
+from auth.jwt_cache import jwt_required_cached
 from utils.export_manager import ExportManager
 
 # Initialize Flask app
@@ -32,11 +28,20 @@ app.config['JWT_SECRET_KEY'] = os.environ.get('JWT_SECRET_KEY', 'jwt-secret-stri
 app.config['JWT_ACCESS_TOKEN_EXPIRES'] = timedelta(hours=24)
 app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///api_weaver.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_pre_ping': True,
+    'pool_recycle': 1800
+}
+if not app.config['SQLALCHEMY_DATABASE_URI'].startswith('sqlite'):
+    # SQLite's pools don't take sizing arguments
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'].update({
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 20)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 40))
+    })
 
 # Initialize extensions
 CORS(app)
 jwt = JWTManager(app)
-db = SQLAlchemy()
 db.init_app(app)
 migrate = Migrate(app, db)
 
@@ -56,6 +61,8 @@ swagger = Swagger(app, template={
 # Initialize managers
 auth_manager = AuthManager()
 export_manager = ExportManager()
+api_generator = APIGenerator()
+connector_registry = ConnectorRegistry()
 
 @app.route('/')
 def home():
@@ -66,14 +73,15 @@ def home():
         "docs": "/api/docs"
     })
 
+# Health checks fire constantly from load balancers; serialize the
+# static part once and append only the timestamp per request
+_HEALTH_BODY_PREFIX = b'{"status":"healthy","service":"API Weaver","timestamp":'
+
 @app.route('/api/health')
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        "status": "healthy",
-        "service": "API Weaver",
-        "timestamp": str(datetime.utcnow())
-    })
+    body = _HEALTH_BODY_PREFIX + repr(time.time()).encode('ascii') + b'}'
+    return app.response_class(body, mimetype='application/json')
 
 # Database connection endpoints
 @app.route('/api/connect/mysql', methods=['POST'])
@@ -110,16 +118,15 @@ def connect_mysql():
     """
     try:
         data = request.get_json()
-        connector = MySQLConnector()
-        connection = connector.connect(
+        connector = connector_registry.get_mysql(
             host=data['host'],
             port=data.get('port', 3306),
             username=data['username'],
             password=data['password'],
             database=data['database']
         )
-        
-        if connection:
+
+        if connector:
             return jsonify({
                 "status": "success",
                 "message": "Successfully connected to MySQL",
@@ -158,13 +165,12 @@ def connect_mongodb():
     """
     try:
         data = request.get_json()
-        connector = MongoDBConnector()
-        connection = connector.connect(
+        connector = connector_registry.get_mongodb(
             connection_string=data['connection_string'],
             database=data['database']
         )
-        
-        if connection:
+
+        if connector:
             return jsonify({
                 "status": "success",
                 "message": "Successfully connected to MongoDB",
@@ -215,21 +221,38 @@ def generate_api():
     """
     try:
         data = request.get_json()
-        generator = APIGenerator()
-        
-        result = generator.generate_api(
+
+        result = api_generator.generate_api(
             database_type=data['database_type'],
             tables=data['tables'],
             framework=data['framework'],
-            include_auth=data.get('include_auth', False)
+            include_auth=data.get('include_auth', False),
+            connection_config=data.get('connection')
         )
-        
-        return jsonify({
+
+        # The generator validates its inputs cheaply up front; bail
+        # before paying for database introspection on a bad request
+        if result['status'] == 'error':
+            return jsonify(result), 400
+
+        # Introspect all requested tables in one batch when connection
+        # credentials are supplied, reusing the registry's connector
+        schemas = None
+        connector = connector_registry.get_for_config(
+            data['database_type'], data.get('connection')
+        )
+        if connector:
+            schemas = connector.get_schemas(data['tables'])
+
+        response = {
             "status": "success",
             "message": "API generated successfully",
             "download_url": result['download_url'],
             "swagger_url": result['swagger_url']
-        })
+        }
+        if schemas is not None:
+            response["schemas"] = schemas
+        return jsonify(response)
     except Exception as e:
         return jsonify({
             "status": "error",
@@ -248,24 +271,97 @@ def login():
     return auth_manager.login(request)
 
 @app.route('/api/auth/logout', methods=['POST'])
-@jwt_required()
+@jwt_required_cached()
 def logout():
     """User logout"""
     return auth_manager.logout()
 
 @app.route('/api/auth/me', methods=['GET'])
-@jwt_required()
+@jwt_required_cached()
 def get_current_user():
     """Get current user info"""
     return auth_manager.get_current_user()
 
+@app.route('/api/download/<project_id>', methods=['GET'])
+def download_project(project_id):
+    """Download a generated project as a ZIP archive"""
+    # The archive is deflated here, on first demand, rather than on the
+    # generation request; abandoned projects never pay the zip cost
+    buffer = api_generator.stream_zip(project_id)
+    if buffer is None:
+        return jsonify({
+            "status": "error",
+            "message": "Project not found"
+        }), 404
+    return send_file(
+        buffer,
+        mimetype='application/zip',
+        as_attachment=True,
+        download_name=f'{project_id}.zip'
+    )
+
 # Export endpoints
 @app.route('/api/export/<project_id>', methods=['GET'])
 def export_project(project_id):
     """Export generated API project"""
-    return export_manager.export_project(project_id)
+    # The archive is streamed while it is built: the first bytes go
+    # out after the first entry instead of after the whole ZIP has
+    # been written to disk and read back
+    stream = export_manager.stream_export(project_id)
+    if stream is None:
+        return jsonify({
+            "status": "error",
+            "message": "Project not found"
+        }), 404
+    return Response(
+        stream_with_context(stream),
+        mimetype='application/zip',
+        headers={'Content-Disposition': f'attachment; filename={project_id}.zip'}
+    )
 
-if __name__ == '__main__':
+@app.route('/api/export/<project_id>/archive', methods=['POST'])
+def export_project_archive(project_id):
+    """Build a project's export archive in the background"""
+    # Deflate runs on the export pool, not this worker; the client
+    # polls the status URL and fetches the archive when it is ready
+    result = export_manager.export_project_async(
+        project_id,
+        deployment_target=request.args.get('deployment_target')
+    )
+    status = 404 if result['status'] == 'error' else 202
+    return jsonify(result), status
+
+@app.route('/api/export/status/<job_id>', methods=['GET'])
+def export_status(job_id):
+    """Check on a background export job"""
+    result = export_manager.export_status(job_id)
+    if result['status'] == 'error' and result.get('message') == 'Unknown export job':
+        return jsonify(result), 404
+    return jsonify(result)
+
+@app.route('/download/<path:filename>', methods=['GET'])
+def download_export(filename):
+    """Serve a materialized export archive from disk"""
+    # Goes through wsgi.file_wrapper, so servers that implement it
+    # (gunicorn, uwsgi) push the file with sendfile(2) instead of
+    # copying it through Python; conditional=True adds range and
+    # not-modified handling for free
+    return send_from_directory(
+        export_manager.export_dir,
+        filename,
+        as_attachment=True,
+        conditional=True
+    )
+
+def init_db():
+    """Create database tables (run once at deploy time, not per worker)"""
     with app.app_context():
         db.create_all()
+
+if __name__ == '__main__':
+    # Development entry point only. In production serve with workers
+    # instead of the blocking debug server:
+    #   gunicorn -w 4 -b 0.0.0.0:5000 app:app
+    #   uvicorn asgi:asgi_app --workers 4   (see asgi.py)
+    init_db()
     app.run(debug=True, host='0.0.0.0', port=5000)
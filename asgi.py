@@ -0,0 +1,15 @@
+"""
+API Weaver - ASGI Entry Point
+Serves the Flask app through an ASGI adapter so Uvicorn's event loop
+multiplexes I/O-bound requests (DB connects, schema introspection)
+instead of dedicating a WSGI worker thread to each one.
+
+Run with:
+    uvicorn asgi:asgi_app --host 0.0.0.0 --port 5000 --workers 4
+"""
+
+from asgiref.wsgi import WsgiToAsgi
+
+from app import app
+
+asgi_app = WsgiToAsgi(app)
@@ -4,18 +4,80 @@ Handles JWT-based authentication
 """
 
 from flask import request, jsonify
-from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
+from flask_jwt_extended import create_access_token
 from werkzeug.security import generate_password_hash, check_password_hash
+from auth.jwt_cache import cached_identity
 from models.user import User, db
+from sqlalchemy.exc import IntegrityError
+from cachetools import TTLCache
 from datetime import datetime
 import re
 
+# Compiled once at import so validation doesn't re-parse the patterns
+# on every registration attempt
+_USERNAME_PATTERN = re.compile(r'^[a-zA-Z0-9_]+$')
+_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Auth payloads are a few short fields; anything bigger is rejected
+# before the JSON parser touches it
+_MAX_BODY_BYTES = 8192
+
+# Serialized user rows change rarely; a short-lived cache avoids one
+# SELECT per authenticated request
+_user_cache = TTLCache(maxsize=1024, ttl=30)
+
+
+def _load_user_dict(user_id):
+    """Load a user as a dict, caching the result for a short window"""
+    cached = _user_cache.get(user_id)
+    if cached is not None:
+        return cached
+
+    user = User.query.get(user_id)
+    if not user or not user.is_active:
+        return None
+
+    user_dict = user.to_dict()
+    _user_cache[user_id] = user_dict
+    return user_dict
+
+
+def invalidate_user_cache(user_id):
+    """Drop a cached user after a profile update or deactivation"""
+    _user_cache.pop(user_id, None)
+
+
 class AuthManager:
     """Authentication manager for user registration, login, and JWT handling"""
-    
+
     def __init__(self):
         pass
-    
+
+    def _get_json(self, request):
+        """
+        Parse a small JSON request body
+
+        Args:
+            request: Flask request object
+
+        Returns:
+            Tuple of (data, error_response); exactly one is None
+        """
+        if request.content_length and request.content_length > _MAX_BODY_BYTES:
+            return None, (jsonify({
+                'status': 'error',
+                'message': 'Request body too large'
+            }), 413)
+
+        data = request.get_json(silent=True)
+        if data is None:
+            return None, (jsonify({
+                'status': 'error',
+                'message': 'Request body must be valid JSON'
+            }), 400)
+
+        return data, None
+
     def register(self, request):
         """
         Register a new user
@@ -27,8 +89,10 @@ class AuthManager:
             JSON response with registration result
         """
         try:
-            data = request.get_json()
-            
+            data, error = self._get_json(request)
+            if error:
+                return error
+
             # Validate input
             validation_result = self._validate_registration_data(data)
             if not validation_result['valid']:
@@ -37,17 +101,16 @@ class AuthManager:
                     'message': validation_result['message']
                 }), 400
             
-            # Check if user already exists
-            if User.query.filter_by(username=data['username']).first():
-                return jsonify({
-                    'status': 'error',
-                    'message': 'Username already exists'
-                }), 400
-            
-            if User.query.filter_by(email=data['email']).first():
+            # Check if user already exists (single SELECT for both fields)
+            existing = User.query.filter(
+                (User.username == data['username']) |
+                (User.email == data['email'])
+            ).first()
+            if existing:
+                field = 'Username' if existing.username == data['username'] else 'Email'
                 return jsonify({
                     'status': 'error',
-                    'message': 'Email already exists'
+                    'message': f'{field} already exists'
                 }), 400
             
             # Create new user
@@ -70,7 +133,15 @@ class AuthManager:
                 'access_token': access_token,
                 'user': user.to_dict()
             }), 201
-            
+
+        except IntegrityError:
+            # Concurrent registration slipped past the existence check;
+            # the UNIQUE indexes on username/email are the backstop
+            db.session.rollback()
+            return jsonify({
+                'status': 'error',
+                'message': 'Username or email already exists'
+            }), 400
         except Exception as e:
             db.session.rollback()
             return jsonify({
@@ -89,8 +160,10 @@ class AuthManager:
             JSON response with login result
         """
         try:
-            data = request.get_json()
-            
+            data, error = self._get_json(request)
+            if error:
+                return error
+
             # Validate input
             if not data.get('username') or not data.get('password'):
                 return jsonify({
@@ -160,18 +233,18 @@ class AuthManager:
             JSON response with current user info
         """
         try:
-            current_user_id = get_jwt_identity()
-            user = User.query.get(current_user_id)
-            
-            if not user:
+            current_user_id = cached_identity()
+            user_dict = _load_user_dict(current_user_id)
+
+            if not user_dict:
                 return jsonify({
                     'status': 'error',
                     'message': 'User not found'
                 }), 404
-            
+
             return jsonify({
                 'status': 'success',
-                'user': user.to_dict()
+                'user': user_dict
             }), 200
             
         except Exception as e:
@@ -206,15 +279,14 @@ class AuthManager:
                 'message': 'Username must be at least 3 characters long'
             }
         
-        if not re.match(r'^[a-zA-Z0-9_]+$', data['username']):
+        if not _USERNAME_PATTERN.match(data['username']):
             return {
                 'valid': False,
                 'message': 'Username can only contain letters, numbers, and underscores'
             }
         
         # Validate email
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, data['email']):
+        if not _EMAIL_PATTERN.match(data['email']):
             return {
                 'valid': False,
                 'message': 'Invalid email format'
@@ -2,12 +2,32 @@
 MongoDB Database Connector for API Weaver
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pymongo import MongoClient
+from cachetools import TTLCache
 from typing import Dict, List, Any, Optional
 import json
+
+# Schemas change rarely compared to how often the UI re-scans them;
+# a short TTL makes repeated /api/generate passes free
+_SCHEMA_CACHE_TTL = 60
 from bson import ObjectId
 from bson.json_util import dumps
 
+# MongoClient maintains its own connection pool and is safe to share,
+# so keep one long-lived client per connection string instead of
+# building and tearing down a socket on every request
+_mongo_clients: Dict[str, MongoClient] = {}
+
+def _jsonable(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a sampled document to plain JSON-safe types
+
+    Raw documents carry bson values (ObjectId, datetime, Decimal128)
+    that Flask's JSON provider can't serialize; json_util's extended
+    JSON round-trip maps them all to JSON-safe equivalents.
+    """
+    return json.loads(dumps(doc))
+
 class MongoDBConnector:
     """MongoDB database connector for schema reading and API generation"""
     
@@ -15,6 +35,7 @@ class MongoDBConnector:
         self.client = None
         self.database = None
         self.db_name = None
+        self._metadata_cache = TTLCache(maxsize=256, ttl=_SCHEMA_CACHE_TTL)
     
     def connect(self, connection_string: str, database: str) -> bool:
         """
@@ -28,7 +49,11 @@ class MongoDBConnector:
             bool: True if connection successful, False otherwise
         """
         try:
-            self.client = MongoClient(connection_string)
+            client = _mongo_clients.get(connection_string)
+            if client is None:
+                client = MongoClient(connection_string, maxPoolSize=50)
+                _mongo_clients[connection_string] = client
+            self.client = client
             self.database = self.client[database]
             self.db_name = database
             
@@ -46,8 +71,14 @@ class MongoDBConnector:
         Returns:
             List[str]: List of collection names
         """
+        cached = self._metadata_cache.get('collections')
+        if cached is not None:
+            return cached
+
         try:
-            return self.database.list_collection_names()
+            collections = self.database.list_collection_names()
+            self._metadata_cache['collections'] = collections
+            return collections
         except Exception as e:
             print(f"Error getting collections: {e}")
             return []
@@ -62,13 +93,33 @@ class MongoDBConnector:
         Returns:
             Dict: Collection schema information
         """
+        cached = self._metadata_cache.get(('schema', collection_name))
+        if cached is not None:
+            return cached
+
         try:
             collection = self.database[collection_name]
-            
-            # Get sample documents to analyze schema
-            sample_docs = list(collection.find().limit(10))
-            
-            if not sample_docs:
+
+            # Sample documents server-side so schema inference sees a
+            # spread of the collection, not just the first insertion
+            # order; stream the cursor and analyze field types as the
+            # batches arrive instead of materializing the whole sample
+            cursor = collection.aggregate([{'$sample': {'size': 10}}],
+                                          batchSize=10)
+
+            field_types = {}
+            sample_data = []
+            for doc in cursor:
+                if len(sample_data) < 3:
+                    # Sanitized here, before the schema is cached, so
+                    # every consumer gets JSON-safe sample documents
+                    sample_data.append(_jsonable(doc))
+                for field, value in doc.items():
+                    if field not in field_types:
+                        field_types[field] = set()
+                    field_types[field].add(type(value).__name__)
+
+            if not field_types:
                 return {
                     'collection_name': collection_name,
                     'fields': [],
@@ -76,14 +127,6 @@ class MongoDBConnector:
                     'sample_data': []
                 }
             
-            # Analyze field types from sample documents
-            field_types = {}
-            for doc in sample_docs:
-                for field, value in doc.items():
-                    if field not in field_types:
-                        field_types[field] = set()
-                    field_types[field].add(type(value).__name__)
-            
             # Convert to schema format
             fields = []
             for field, types in field_types.items():
@@ -95,20 +138,43 @@ class MongoDBConnector:
                 }
                 fields.append(field_info)
             
-            # Get total document count
-            total_docs = collection.count_documents({})
-            
-            return {
+            # Get total document count from collection metadata instead
+            # of a full count_documents scan
+            total_docs = collection.estimated_document_count()
+
+            schema = {
                 'collection_name': collection_name,
                 'fields': fields,
                 'total_documents': total_docs,
-                'sample_data': sample_docs[:3]  # First 3 documents as sample
+                'sample_data': sample_data  # First 3 documents as sample
             }
+            self._metadata_cache[('schema', collection_name)] = schema
+            return schema
             
         except Exception as e:
             print(f"Error getting collection schema for {collection_name}: {e}")
             return {}
     
+    def get_schemas(self, collection_names: List[str]) -> Dict[str, Any]:
+        """
+        Get schemas for several collections concurrently
+
+        MongoClient is thread-safe, so the per-collection sampling
+        queries run in parallel on a thread pool.
+
+        Args:
+            collection_names: Names of the collections
+
+        Returns:
+            Dict: Mapping of collection name to schema
+        """
+        if not collection_names:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(8, len(collection_names))) as pool:
+            schemas = pool.map(self.get_collection_schema, collection_names)
+        return dict(zip(collection_names, schemas))
+
     def get_sample_data(self, collection_name: str, limit: int = 5) -> List[Dict]:
         """
         Get sample data from a collection
@@ -191,10 +257,7 @@ class MongoDBConnector:
         return operations
     
     def close(self):
-        """Close database connection"""
-        if self.client:
-            self.client.close()
-    
-    def __del__(self):
-        """Destructor to ensure connection is closed"""
-        self.close()
+        """Release the shared client without closing its pool"""
+        self.client = None
+        self.database = None
+        self.db_name = None
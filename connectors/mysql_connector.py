@@ -2,18 +2,44 @@
 MySQL Database Connector for API Weaver
 """
 
+import hashlib
+import threading
 import pymysql
-import pandas as pd
+from cachetools import TTLCache
 from typing import Dict, List, Any, Optional
 import json
 
+# Schemas change rarely compared to how often the UI re-scans them;
+# a short TTL makes repeated /api/generate passes free
+_SCHEMA_CACHE_TTL = 60
+
+# Reuse one connection per set of credentials across requests instead
+# of reconnecting on every HTTP call; ping(reconnect=True) revives a
+# reused socket if the server dropped it. The key must cover the
+# password too — otherwise a request with the wrong password would be
+# handed a connection opened with the right one — but only a digest of
+# it, so plaintext passwords don't sit in a module-level dict
+_connection_cache: Dict[tuple, Any] = {}
+
+def _cache_key(host: str, port: int, username: str, password: str,
+               database: str) -> tuple:
+    """Connection cache key covering all credentials"""
+    password_digest = hashlib.sha256(password.encode('utf-8')).hexdigest()
+    return (host, port, username, password_digest, database)
+
 class MySQLConnector:
     """MySQL database connector for schema reading and API generation"""
     
     def __init__(self):
         self.connection = None
         self.cursor = None
-    
+        self._metadata_cache = TTLCache(maxsize=256, ttl=_SCHEMA_CACHE_TTL)
+        # A pymysql connection is not thread-safe and the registry
+        # shares one connector across request threads, so every use of
+        # the shared cursor is serialized. RLock because schema reads
+        # nest (get_table_schema -> get_table_row_count)
+        self._lock = threading.RLock()
+
     def connect(self, host: str, port: int, username: str, password: str, database: str) -> bool:
         """
         Connect to MySQL database
@@ -29,21 +55,48 @@ class MySQLConnector:
             bool: True if connection successful, False otherwise
         """
         try:
-            self.connection = pymysql.connect(
-                host=host,
-                port=port,
-                user=username,
-                password=password,
-                database=database,
-                charset='utf8mb4',
-                cursorclass=pymysql.cursors.DictCursor
-            )
-            self.cursor = self.connection.cursor()
+            with self._lock:
+                cache_key = _cache_key(host, port, username, password, database)
+                connection = _connection_cache.get(cache_key)
+                if connection is not None:
+                    connection.ping(reconnect=True)
+                else:
+                    connection = pymysql.connect(
+                        host=host,
+                        port=port,
+                        user=username,
+                        password=password,
+                        database=database,
+                        charset='utf8mb4',
+                        cursorclass=pymysql.cursors.DictCursor
+                    )
+                    _connection_cache[cache_key] = connection
+                self.connection = connection
+                self.cursor = self.connection.cursor()
             return True
         except Exception as e:
             print(f"MySQL connection error: {e}")
             return False
-    
+
+    def ensure_connection(self) -> bool:
+        """
+        Revive the shared connection before reuse
+
+        A cached connector may have idled past the server's
+        wait_timeout since its last request; ping(reconnect=True)
+        reopens the socket in that case.
+
+        Returns:
+            bool: True if the connection is usable
+        """
+        try:
+            with self._lock:
+                self.connection.ping(reconnect=True)
+            return True
+        except Exception as e:
+            print(f"MySQL ping error: {e}")
+            return False
+
     def get_tables(self) -> List[str]:
         """
         Get list of tables in the database
@@ -51,9 +104,15 @@ class MySQLConnector:
         Returns:
             List[str]: List of table names
         """
+        cached = self._metadata_cache.get('tables')
+        if cached is not None:
+            return cached
+
         try:
-            self.cursor.execute("SHOW TABLES")
-            tables = [list(row.values())[0] for row in self.cursor.fetchall()]
+            with self._lock:
+                self.cursor.execute("SHOW TABLES")
+                tables = [list(row.values())[0] for row in self.cursor.fetchall()]
+            self._metadata_cache['tables'] = tables
             return tables
         except Exception as e:
             print(f"Error getting tables: {e}")
@@ -69,40 +128,55 @@ class MySQLConnector:
         Returns:
             Dict: Table schema information
         """
+        cached = self._metadata_cache.get(('schema', table_name))
+        if cached is not None:
+            return cached
+
         try:
-            # Get column information
-            self.cursor.execute(f"DESCRIBE `{table_name}`")
-            columns = self.cursor.fetchall()
-            
-            # Get primary key information
-            self.cursor.execute(f"""
-                SELECT COLUMN_NAME 
-                FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE 
-                WHERE TABLE_SCHEMA = DATABASE() 
-                AND TABLE_NAME = '{table_name}' 
-                AND CONSTRAINT_NAME = 'PRIMARY'
-            """)
-            primary_keys = [row['COLUMN_NAME'] for row in self.cursor.fetchall()]
-            
-            # Get foreign key information
-            self.cursor.execute(f"""
-                SELECT 
-                    COLUMN_NAME,
-                    REFERENCED_TABLE_NAME,
-                    REFERENCED_COLUMN_NAME
-                FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE 
-                WHERE TABLE_SCHEMA = DATABASE() 
-                AND TABLE_NAME = '{table_name}' 
-                AND REFERENCED_TABLE_NAME IS NOT NULL
-            """)
-            foreign_keys = self.cursor.fetchall()
+            with self._lock:
+                # Get column information, including collation and
+                # comments, in one round trip
+                self.cursor.execute(f"SHOW FULL COLUMNS FROM `{table_name}`")
+                columns = self.cursor.fetchall()
+
+                # Get primary and foreign key information in one
+                # parameterized query instead of two string-built ones
+                self.cursor.execute("""
+                    SELECT
+                        CONSTRAINT_NAME,
+                        COLUMN_NAME,
+                        REFERENCED_TABLE_NAME,
+                        REFERENCED_COLUMN_NAME
+                    FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE
+                    WHERE TABLE_SCHEMA = DATABASE()
+                    AND TABLE_NAME = %s
+                    AND (CONSTRAINT_NAME = 'PRIMARY'
+                         OR REFERENCED_TABLE_NAME IS NOT NULL)
+                """, (table_name,))
+                key_rows = self.cursor.fetchall()
+
+                total_rows = self.get_table_row_count(table_name)
+
+            primary_keys = [
+                row['COLUMN_NAME'] for row in key_rows
+                if row['CONSTRAINT_NAME'] == 'PRIMARY'
+            ]
+            foreign_keys = [
+                {
+                    'COLUMN_NAME': row['COLUMN_NAME'],
+                    'REFERENCED_TABLE_NAME': row['REFERENCED_TABLE_NAME'],
+                    'REFERENCED_COLUMN_NAME': row['REFERENCED_COLUMN_NAME']
+                }
+                for row in key_rows
+                if row['REFERENCED_TABLE_NAME'] is not None
+            ]
             
             schema = {
                 'table_name': table_name,
                 'columns': [],
                 'primary_keys': primary_keys,
                 'foreign_keys': foreign_keys,
-                'total_rows': self.get_table_row_count(table_name)
+                'total_rows': total_rows
             }
             
             for column in columns:
@@ -112,34 +186,84 @@ class MySQLConnector:
                     'null': column['Null'] == 'YES',
                     'key': column['Key'],
                     'default': column['Default'],
-                    'extra': column['Extra']
+                    'extra': column['Extra'],
+                    'comment': column.get('Comment', '')
                 }
                 schema['columns'].append(column_info)
-            
+
+            self._metadata_cache[('schema', table_name)] = schema
             return schema
             
         except Exception as e:
             print(f"Error getting table schema for {table_name}: {e}")
             return {}
     
-    def get_table_row_count(self, table_name: str) -> int:
+    def get_table_row_count(self, table_name: str, approximate: bool = True) -> int:
         """
         Get row count for a table
-        
+
         Args:
             table_name: Name of the table
-            
+            approximate: Use the statistics-based estimate from
+                information_schema instead of a full COUNT(*) scan
+
         Returns:
             int: Number of rows in the table
         """
         try:
-            self.cursor.execute(f"SELECT COUNT(*) as count FROM `{table_name}`")
-            result = self.cursor.fetchone()
+            with self._lock:
+                if approximate:
+                    self.cursor.execute("""
+                        SELECT TABLE_ROWS
+                        FROM INFORMATION_SCHEMA.TABLES
+                        WHERE TABLE_SCHEMA = DATABASE()
+                        AND TABLE_NAME = %s
+                    """, (table_name,))
+                    result = self.cursor.fetchone()
+                    if result and result['TABLE_ROWS'] is not None:
+                        return result['TABLE_ROWS']
+
+                self.cursor.execute(f"SELECT COUNT(*) as count FROM `{table_name}`")
+                result = self.cursor.fetchone()
             return result['count']
         except Exception as e:
             print(f"Error getting row count for {table_name}: {e}")
             return 0
+
+    def table_has_rows(self, table_name: str) -> bool:
+        """
+        Check whether a table contains any rows
+
+        Args:
+            table_name: Name of the table
+
+        Returns:
+            bool: True if the table has at least one row
+        """
+        try:
+            with self._lock:
+                self.cursor.execute(f"SELECT 1 FROM `{table_name}` LIMIT 1")
+                return self.cursor.fetchone() is not None
+        except Exception as e:
+            print(f"Error checking rows for {table_name}: {e}")
+            return False
     
+    def get_schemas(self, table_names: List[str]) -> Dict[str, Any]:
+        """
+        Get schemas for several tables in one batch
+
+        A pymysql connection is not thread-safe, so the batch runs
+        sequentially on the shared connection; the per-table TTL cache
+        makes repeat batches free.
+
+        Args:
+            table_names: Names of the tables
+
+        Returns:
+            Dict: Mapping of table name to schema
+        """
+        return {name: self.get_table_schema(name) for name in table_names}
+
     def get_sample_data(self, table_name: str, limit: int = 5) -> List[Dict]:
         """
         Get sample data from a table
@@ -152,8 +276,9 @@ class MySQLConnector:
             List[Dict]: Sample data
         """
         try:
-            self.cursor.execute(f"SELECT * FROM `{table_name}` LIMIT {limit}")
-            return self.cursor.fetchall()
+            with self._lock:
+                self.cursor.execute(f"SELECT * FROM `{table_name}` LIMIT {limit}")
+                return self.cursor.fetchall()
         except Exception as e:
             print(f"Error getting sample data for {table_name}: {e}")
             return []
@@ -222,12 +347,9 @@ class MySQLConnector:
         return operations
     
     def close(self):
-        """Close database connection"""
-        if self.cursor:
-            self.cursor.close()
-        if self.connection:
-            self.connection.close()
-    
-    def __del__(self):
-        """Destructor to ensure connection is closed"""
-        self.close()
+        """Release the shared connection without closing its socket"""
+        with self._lock:
+            if self.cursor:
+                self.cursor.close()
+            self.cursor = None
+            self.connection = None
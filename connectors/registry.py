@@ -0,0 +1,126 @@
+"""
+Connector Registry for API Weaver
+Caches connected database connectors by their connection credentials
+so repeated API calls reuse live connections instead of reconnecting
+"""
+
+import threading
+from typing import Dict, Optional, Any
+
+from connectors.mysql_connector import MySQLConnector, _cache_key as _mysql_cache_key
+from connectors.mongodb_connector import MongoDBConnector
+
+class ConnectorRegistry:
+    """Registry of live connectors keyed by connection credentials"""
+
+    def __init__(self):
+        self._connectors: Dict[tuple, Any] = {}
+        self._lock = threading.Lock()
+
+    def get_mysql(self, host: str, port: int, username: str, password: str,
+                  database: str) -> Optional[MySQLConnector]:
+        """
+        Get a connected MySQL connector, reusing a cached one if present
+
+        Args:
+            host: Database host
+            port: Database port
+            username: Database username
+            password: Database password
+            database: Database name
+
+        Returns:
+            MySQLConnector: Connected connector, or None on failure
+        """
+        # The connector's own cache-key helper covers the password (as
+        # a digest), so a wrong password can't reuse a connector opened
+        # with the right one
+        key = ('mysql',) + _mysql_cache_key(host, port, username, password,
+                                            database)
+        with self._lock:
+            connector = self._connectors.get(key)
+        if connector is None:
+            # Connect outside the registry lock: an unreachable host
+            # blocks only this request for the connect timeout, not
+            # every concurrent registry lookup in the process
+            candidate = MySQLConnector()
+            if not candidate.connect(host=host, port=port, username=username,
+                                     password=password, database=database):
+                return None
+            with self._lock:
+                connector = self._connectors.setdefault(key, candidate)
+            if connector is not candidate:
+                # A concurrent request won the insert; keep its
+                # connector and release ours
+                candidate.close()
+            return connector
+        # A cached connector may have idled past the server's
+        # wait_timeout; revive it before handing it out, and drop it
+        # from the registry if it can't be revived
+        if connector.ensure_connection():
+            return connector
+        with self._lock:
+            self._connectors.pop(key, None)
+        return None
+
+    def get_mongodb(self, connection_string: str,
+                    database: str) -> Optional[MongoDBConnector]:
+        """
+        Get a connected MongoDB connector, reusing a cached one if present
+
+        Args:
+            connection_string: MongoDB connection string
+            database: Database name
+
+        Returns:
+            MongoDBConnector: Connected connector, or None on failure
+        """
+        key = ('mongodb', connection_string, database)
+        with self._lock:
+            connector = self._connectors.get(key)
+        if connector is not None:
+            return connector
+        # Connect outside the registry lock: the ping inside connect()
+        # waits out the full server-selection timeout for an
+        # unreachable host, which must not stall other lookups
+        candidate = MongoDBConnector()
+        if not candidate.connect(connection_string=connection_string,
+                                 database=database):
+            return None
+        with self._lock:
+            connector = self._connectors.setdefault(key, candidate)
+        if connector is not candidate:
+            # A concurrent request won the insert; keep its connector
+            # and release ours
+            candidate.close()
+        return connector
+
+    def get_for_config(self, database_type: str,
+                       connection_config: Dict[str, Any]):
+        """
+        Resolve a connector from a request-supplied connection config
+
+        Args:
+            database_type: Type of database (mysql, mongodb)
+            connection_config: Credentials as sent to the connect endpoints
+
+        Returns:
+            Connected connector, or None if the config is missing/invalid
+        """
+        if not connection_config:
+            return None
+
+        if database_type == 'mysql':
+            return self.get_mysql(
+                host=connection_config['host'],
+                port=connection_config.get('port', 3306),
+                username=connection_config['username'],
+                password=connection_config['password'],
+                database=connection_config['database']
+            )
+        elif database_type == 'mongodb':
+            return self.get_mongodb(
+                connection_string=connection_config['connection_string'],
+                database=connection_config['database']
+            )
+        return None
@@ -3,573 +3,491 @@ API Generator for API Weaver
 Generates CRUD APIs from database schemas
 """
 
+import hashlib
 import os
 import json
 import zipfile
+from collections import OrderedDict
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 from datetime import datetime
-import uuid
+
+from generators.templates import TEMPLATES, FLASK_MODELS_INIT
+
+# Constant project files are shipped as bytes so neither the disk
+# write nor zipfile.writestr re-encodes them per request
+_FLASK_MODELS_INIT = FLASK_MODELS_INIT.encode('utf-8')
+
+# Per-table renders are independent; below this many tables the pool
+# overhead outweighs the parallelism
+_RENDER_POOL_THRESHOLD = 4
+
+_SUPPORTED_FRAMEWORKS = ('flask', 'fastapi', 'express')
+_SUPPORTED_DATABASES = ('mysql', 'mongodb')
+
+# Generated sources are small text files: level-1 deflate gets nearly
+# all of the win at a fraction of the CPU, and entries under this size
+# aren't worth compressing at all
+_ZIP_COMPRESSLEVEL = 1
+_ZIP_STORE_THRESHOLD = 256
+
+# Generated projects kept in memory for lazy ZIP assembly on download;
+# oldest entries fall out first
+_PROJECT_CACHE_SIZE = 100
+
+# Constant output fragments, built once at import
+_FLASK_BASE_REQUIREMENTS = (
+    "Flask==2.3.3",
+    "Flask-CORS==4.0.0",
+    "Flask-SQLAlchemy==3.0.5",
+    "gunicorn==21.2.0"
+)
+
+_FASTAPI_BASE_REQUIREMENTS = (
+    "fastapi==0.104.1",
+    "uvicorn==0.24.0",
+    "pydantic==2.5.0"
+)
+
+_DB_REQUIREMENTS = {
+    'mysql': "PyMySQL==1.1.0",
+    'mongodb': "pymongo==4.5.0"
+}
+
+# README endpoint section for one table; formatted once per table and
+# joined in a single pass instead of appending line fragments
+_README_ENDPOINTS_TMPL = """### {title}
+- GET /api/{t} - List all {t}
+- GET /api/{t}/{{id}} - Get {t} by ID
+- POST /api/{t} - Create {t}
+- PUT /api/{t}/{{id}} - Update {t}
+- DELETE /api/{t}/{{id}} - Delete {t}"""
+
+_PACKAGE_JSON = b'''{
+  "name": "api-weaver-generated-api",
+  "version": "1.0.0",
+  "description": "Auto-generated API by API Weaver",
+  "main": "app.js",
+  "scripts": {
+    "start": "node app.js",
+    "dev": "nodemon app.js"
+  },
+  "dependencies": {
+    "express": "^4.18.2",
+    "cors": "^2.8.5",
+    "mongoose": "^7.5.0",
+    "dotenv": "^16.3.1"
+  },
+  "devDependencies": {
+    "nodemon": "^3.0.1"
+  },
+  "keywords": ["api", "generated", "api-weaver"],
+  "author": "API Weaver",
+  "license": "MIT"
+}'''
 
 class APIGenerator:
     """Main API generator class"""
-    
+
     def __init__(self):
         self.output_dir = "generated_apis"
+        # Results keyed by a hash of the generation request, so
+        # identical requests reuse the already-built project
+        self._result_cache: Dict[str, Dict[str, Any]] = {}
+        # Rendered file contents per project, LRU-bounded; the ZIP is
+        # only deflated if and when the project is actually downloaded
+        self._projects: 'OrderedDict[str, Dict[str, bytes]]' = OrderedDict()
         self.ensure_output_dir()
-    
+
     def ensure_output_dir(self):
         """Ensure output directory exists"""
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
-    
-    def generate_api(self, database_type: str, tables: List[str], framework: str, 
+        os.makedirs(self.output_dir, exist_ok=True)
+
+    def generate_api(self, database_type: str, tables: List[str], framework: str,
                     include_auth: bool = False, connection_config: Dict = None) -> Dict[str, Any]:
         """
         Generate API from database schema
-        
+
         Args:
             database_type: Type of database (mysql, mongodb)
             tables: List of table/collection names
             framework: Target framework (flask, fastapi, express)
             include_auth: Whether to include authentication
             connection_config: Database connection configuration
-            
+
         Returns:
             Dict: Generation result with download URL and swagger URL
         """
+        # Cheap validation up front instead of letting bad input surface
+        # as an exception halfway through generation
+        if framework not in _SUPPORTED_FRAMEWORKS:
+            return {'status': 'error', 'message': f"Unsupported framework: {framework}"}
+        if database_type not in _SUPPORTED_DATABASES:
+            return {'status': 'error', 'message': f"Unsupported database type: {database_type}"}
+        if not tables:
+            return {'status': 'error', 'message': 'No tables selected'}
+
         try:
-            project_id = str(uuid.uuid4())
+            # The project id is the fingerprint of the inputs, so
+            # repeated identical requests map to the same project and
+            # skip the generation pass entirely
+            project_id = self._request_hash(database_type, tables, framework, include_auth)
+            cached = self._result_cache.get(project_id)
+            if cached and project_id in self._projects:
+                return cached
+
             project_dir = os.path.join(self.output_dir, project_id)
             os.makedirs(project_dir, exist_ok=True)
-            
-            # Generate API based on framework
+
+            # Generate the whole project in memory
             if framework == 'flask':
-                result = self._generate_flask_api(project_dir, database_type, tables, include_auth)
+                files = self._generate_flask_api(database_type, tables, include_auth)
             elif framework == 'fastapi':
-                result = self._generate_fastapi_api(project_dir, database_type, tables, include_auth)
-            elif framework == 'express':
-                result = self._generate_express_api(project_dir, database_type, tables, include_auth)
+                files = self._generate_fastapi_api(database_type, tables, include_auth)
             else:
-                raise ValueError(f"Unsupported framework: {framework}")
-            
-            # Create ZIP file
-            zip_path = f"{project_dir}.zip"
-            self._create_zip_file(project_dir, zip_path)
-            
-            return {
+                files = self._generate_express_api(database_type, tables, include_auth)
+
+            # Materialize the project directory (export/deploy read it)
+            # and keep the rendered contents around; the ZIP is built
+            # lazily on the first download instead of on this request
+            self._write_project_files(project_dir, files)
+            self._cache_project(project_id, files)
+
+            result = {
                 'status': 'success',
                 'project_id': project_id,
                 'download_url': f'/api/download/{project_id}',
-                'swagger_url': f'/api/swagger/{project_id}',
-                'zip_path': zip_path
+                'swagger_url': f'/api/swagger/{project_id}'
             }
-            
+            self._result_cache[project_id] = result
+            return result
+
         except Exception as e:
             return {
                 'status': 'error',
                 'message': str(e)
             }
-    
-    def _generate_flask_api(self, project_dir: str, database_type: str, 
-                           tables: List[str], include_auth: bool) -> Dict:
-        """Generate Flask API"""
-        
-        # Create main app.py
-        app_content = self._generate_flask_app_content(database_type, tables, include_auth)
-        with open(os.path.join(project_dir, 'app.py'), 'w') as f:
-            f.write(app_content)
-        
-        # Create requirements.txt
-        requirements = self._generate_requirements_content(database_type)
-        with open(os.path.join(project_dir, 'requirements.txt'), 'w') as f:
-            f.write(requirements)
-        
-        # Create models
-        models_dir = os.path.join(project_dir, 'models')
-        os.makedirs(models_dir, exist_ok=True)
-        
-        for table in tables:
-            model_content = self._generate_flask_model(table, database_type)
-            with open(os.path.join(models_dir, f'{table}.py'), 'w') as f:
-                f.write(model_content)
-        
-        # Create routes
-        routes_dir = os.path.join(project_dir, 'routes')
-        os.makedirs(routes_dir, exist_ok=True)
-        
-        for table in tables:
-            route_content = self._generate_flask_routes(table)
-            with open(os.path.join(routes_dir, f'{table}_routes.py'), 'w') as f:
-                f.write(route_content)
-        
-        # Create README
-        readme_content = self._generate_readme_content('Flask', database_type, tables)
-        with open(os.path.join(project_dir, 'README.md'), 'w') as f:
-            f.write(readme_content)
-        
-        return {'framework': 'flask', 'tables': tables}
-    
-    def _generate_fastapi_api(self, project_dir: str, database_type: str, 
-                            tables: List[str], include_auth: bool) -> Dict:
-        """Generate FastAPI API"""
-        
-        # Create main main.py
-        main_content = self._generate_fastapi_main_content(database_type, tables, include_auth)
-        with open(os.path.join(project_dir, 'main.py'), 'w') as f:
-            f.write(main_content)
-        
-        # Create requirements.txt
-        requirements = self._generate_fastapi_requirements_content(database_type)
-        with open(os.path.join(project_dir, 'requirements.txt'), 'w') as f:
-            f.write(requirements)
-        
-        # Create models
-        models_dir = os.path.join(project_dir, 'models')
-        os.makedirs(models_dir, exist_ok=True)
-        
-        for table in tables:
-            model_content = self._generate_fastapi_model(table, database_type)
-            with open(os.path.join(models_dir, f'{table}.py'), 'w') as f:
-                f.write(model_content)
-        
-        # Create README
-        readme_content = self._generate_readme_content('FastAPI', database_type, tables)
-        with open(os.path.join(project_dir, 'README.md'), 'w') as f:
-            f.write(readme_content)
-        
-        return {'framework': 'fastapi', 'tables': tables}
-    
-    def _generate_express_api(self, project_dir: str, database_type: str, 
-                            tables: List[str], include_auth: bool) -> Dict:
-        """Generate Express.js API"""
-        
-        # Create main app.js
-        app_content = self._generate_express_app_content(database_type, tables, include_auth)
-        with open(os.path.join(project_dir, 'app.js'), 'w') as f:
-            f.write(app_content)
-        
-        # Create package.json
-        package_content = self._generate_package_json_content(database_type)
-        with open(os.path.join(project_dir, 'package.json'), 'w') as f:
-            f.write(package_content)
-        
-        # Create models
-        models_dir = os.path.join(project_dir, 'models')
-        os.makedirs(models_dir, exist_ok=True)
-        
-        for table in tables:
-            model_content = self._generate_express_model(table, database_type)
-            with open(os.path.join(models_dir, f'{table}.js'), 'w') as f:
-                f.write(model_content)
-        
-        # Create routes
-        routes_dir = os.path.join(project_dir, 'routes')
-        os.makedirs(routes_dir, exist_ok=True)
-        
-        for table in tables:
-            route_content = self._generate_express_routes(table)
-            with open(os.path.join(routes_dir, f'{table}Routes.js'), 'w') as f:
-                f.write(route_content)
-        
-        # Create README
-        readme_content = self._generate_readme_content('Express.js', database_type, tables)
-        with open(os.path.join(project_dir, 'README.md'), 'w') as f:
-            f.write(readme_content)
-        
-        return {'framework': 'express', 'tables': tables}
-    
-    def _generate_flask_app_content(self, database_type: str, tables: List[str], include_auth: bool) -> str:
-        """Generate Flask app.py content"""
-        import_lines = []
-        blueprint_lines = []
-        register_lines = []
-        
-        for table in tables:
-            import_lines.append(f"from models.{table} import {table.title().replace('_', '')}")
-            blueprint_lines.append(f"from routes.{table}_routes import {table}_bp")
-            register_lines.append(f"app.register_blueprint({table}_bp, url_prefix='/api/{table}')")
-        
-        return f'''"""
-Generated Flask API by API Weaver
-Database: {database_type}
-Tables: {', '.join(tables)}
-Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
 
-from flask import Flask, request, jsonify
-from flask_cors import CORS
-from flask_sqlalchemy import SQLAlchemy
-from datetime import datetime
-import os
+    @staticmethod
+    def _request_hash(database_type: str, tables: List[str], framework: str,
+                      include_auth: bool) -> str:
+        """Fingerprint the inputs that determine a generated project's
+        content; blake2b is plenty for non-cryptographic identity and
+        cheaper than sha256"""
+        key = repr((database_type, tuple(tables), framework, include_auth))
+        return hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _table_info(table_name: str) -> Dict[str, str]:
+        """Derive the template context for a table name (cached; the
+        same names recur across model, route, and app renders)"""
+        title = table_name.title()
+        return {
+            'name': table_name,
+            'title': title,
+            'class_name': title.replace('_', '')
+        }
+
+    @staticmethod
+    def _render_bytes(template_name: str, **context) -> bytes:
+        """Render a template and encode it exactly once; the same
+        bytes feed both the disk write and the ZIP entry"""
+        return TEMPLATES[template_name].render(**context).encode('utf-8')
+
+    def _render_tables(self, tables: List[str], render_one) -> Dict[str, bytes]:
+        """
+        Render per-table files, in parallel for larger table sets
 
-app = Flask(__name__)
-app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///app.db')
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-
-# Initialize extensions
-CORS(app)
-db = SQLAlchemy(app)
-
-# Import models
-{chr(10).join(import_lines)}
-
-# Import routes
-{chr(10).join(blueprint_lines)}
-
-# Register blueprints
-{chr(10).join(register_lines)}
-
-@app.route('/')
-def home():
-    return jsonify({{
-        "message": "API Weaver Generated API",
-        "version": "1.0.0",
-        "tables": {tables},
-        "docs": "/docs"
-    }})
-
-@app.route('/health')
-def health():
-    return jsonify({{"status": "healthy", "timestamp": datetime.utcnow().isoformat()}})
-
-if __name__ == '__main__':
-    with app.app_context():
-        db.create_all()
-    app.run(debug=True, host='0.0.0.0', port=5000)
-'''
-    
-    def _generate_flask_model(self, table_name: str, database_type: str) -> str:
-        """Generate Flask model for a table"""
-        return f'''"""
-{table_name.title()} Model
-Generated by API Weaver
-"""
+        Args:
+            tables: Table names to render
+            render_one: Callable mapping a table name to a dict of
+                {relative path: content} entries
 
-from flask_sqlalchemy import SQLAlchemy
-from datetime import datetime
+        Returns:
+            Dict: Merged file entries for all tables
+        """
+        if len(tables) < _RENDER_POOL_THRESHOLD:
+            rendered = map(render_one, tables)
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(tables))) as pool:
+                rendered = pool.map(render_one, tables)
+
+        files = {}
+        for entries in rendered:
+            files.update(entries)
+        return files
+
+    def _generate_flask_api(self, database_type: str, tables: List[str],
+                            include_auth: bool) -> Dict[str, bytes]:
+        """Generate Flask project files in memory"""
+        # Shared per-request strings, computed once rather than per file
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        table_list = ', '.join(tables)
+
+        files = {
+            'app.py': self._generate_flask_app_content(database_type, tables, include_auth,
+                                                       timestamp, table_list),
+            'requirements.txt': self._generate_requirements_content(database_type),
+            'README.md': self._generate_readme_content('Flask', database_type, tables,
+                                                       timestamp, table_list),
+            'models/__init__.py': _FLASK_MODELS_INIT
+        }
+
+        def render_one(table):
+            return {
+                f'models/{table}.py': self._generate_flask_model(table, database_type),
+                f'routes/{table}_routes.py': self._generate_flask_routes(table)
+            }
 
-db = SQLAlchemy()
-
-class {table_name.title().replace('_', '')}(db.Model):
-    """{table_name.title()} model"""
-    
-    __tablename__ = '{table_name}'
-    
-    id = db.Column(db.Integer, primary_key=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    
-    def to_dict(self):
-        """Convert to dictionary"""
-        return {{
-            'id': self.id,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }}
-    
-    def __repr__(self):
-        return f'<{table_name.title().replace('_', '')} {{self.id}}>'
-'''
-    
-    def _generate_flask_routes(self, table_name: str) -> str:
-        """Generate Flask routes for a table"""
-        return f'''"""
-{table_name.title()} Routes
-Generated by API Weaver
-"""
+        files.update(self._render_tables(tables, render_one))
+        return files
+
+    def _generate_fastapi_api(self, database_type: str, tables: List[str],
+                              include_auth: bool) -> Dict[str, bytes]:
+        """Generate FastAPI project files in memory"""
+        # Shared per-request strings, computed once rather than per file
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        table_list = ', '.join(tables)
+
+        files = {
+            'main.py': self._generate_fastapi_main_content(database_type, tables, include_auth,
+                                                           timestamp, table_list),
+            'requirements.txt': self._generate_fastapi_requirements_content(database_type),
+            'README.md': self._generate_readme_content('FastAPI', database_type, tables,
+                                                       timestamp, table_list)
+        }
+
+        def render_one(table):
+            return {f'models/{table}.py': self._generate_fastapi_model(table, database_type)}
+
+        files.update(self._render_tables(tables, render_one))
+        return files
+
+    def _generate_express_api(self, database_type: str, tables: List[str],
+                              include_auth: bool) -> Dict[str, bytes]:
+        """Generate Express.js project files in memory"""
+        # Shared per-request strings, computed once rather than per file
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        table_list = ', '.join(tables)
+
+        files = {
+            'app.js': self._generate_express_app_content(database_type, tables, include_auth,
+                                                         timestamp, table_list),
+            'package.json': self._generate_package_json_content(database_type),
+            'README.md': self._generate_readme_content('Express.js', database_type, tables,
+                                                       timestamp, table_list)
+        }
+
+        def render_one(table):
+            return {
+                f'models/{table}.js': self._generate_express_model(table, database_type),
+                f'routes/{table}Routes.js': self._generate_express_routes(table)
+            }
 
-from flask import Blueprint, request, jsonify
-from models.{table_name} import {table_name.title().replace('_', '')}
-from flask_sqlalchemy import SQLAlchemy
-
-{table_name}_bp = Blueprint('{table_name}', __name__)
-
-@{table_name}_bp.route('/', methods=['GET'])
-def get_{table_name}():
-    """Get all {table_name}"""
-    try:
-        {table_name} = {table_name.title().replace('_', '')}.query.all()
-        return jsonify([item.to_dict() for item in {table_name}])
-    except Exception as e:
-        return jsonify({{'error': str(e)}}), 500
-
-@{table_name}_bp.route('/<int:id>', methods=['GET'])
-def get_{table_name}_by_id(id):
-    """Get {table_name} by ID"""
-    try:
-        {table_name} = {table_name.title().replace('_', '')}.query.get_or_404(id)
-        return jsonify({table_name}.to_dict())
-    except Exception as e:
-        return jsonify({{'error': str(e)}}), 500
-
-@{table_name}_bp.route('/', methods=['POST'])
-def create_{table_name}():
-    """Create new {table_name}"""
-    try:
-        data = request.get_json()
-        {table_name} = {table_name.title().replace('_', '')}(**data)
-        db.session.add({table_name})
-        db.session.commit()
-        return jsonify({table_name}.to_dict()), 201
-    except Exception as e:
-        db.session.rollback()
-        return jsonify({{'error': str(e)}}), 500
-
-@{table_name}_bp.route('/<int:id>', methods=['PUT'])
-def update_{table_name}(id):
-    """Update {table_name}"""
-    try:
-        {table_name} = {table_name.title().replace('_', '')}.query.get_or_404(id)
-        data = request.get_json()
-        for key, value in data.items():
-            setattr({table_name}, key, value)
-        db.session.commit()
-        return jsonify({table_name}.to_dict())
-    except Exception as e:
-        db.session.rollback()
-        return jsonify({{'error': str(e)}}), 500
-
-@{table_name}_bp.route('/<int:id>', methods=['DELETE'])
-def delete_{table_name}(id):
-    """Delete {table_name}"""
-    try:
-        {table_name} = {table_name.title().replace('_', '')}.query.get_or_404(id)
-        db.session.delete({table_name})
-        db.session.commit()
-        return jsonify({{'message': 'Deleted successfully'}})
-    except Exception as e:
-        db.session.rollback()
-        return jsonify({{'error': str(e)}}), 500
-'''
-    
-    def _generate_requirements_content(self, database_type: str) -> str:
-        """Generate requirements.txt content"""
-        base_requirements = [
-            "Flask==2.3.3",
-            "Flask-CORS==4.0.0",
-            "Flask-SQLAlchemy==3.0.5",
-            "gunicorn==21.2.0"
-        ]
-        
-        if database_type == 'mysql':
-            base_requirements.append("PyMySQL==1.1.0")
-        elif database_type == 'mongodb':
-            base_requirements.append("pymongo==4.5.0")
-        
-        return '\n'.join(base_requirements)
-    
-    def _generate_fastapi_main_content(self, database_type: str, tables: List[str], include_auth: bool) -> str:
-        """Generate FastAPI main.py content"""
-        import_lines = []
-        include_lines = []
-        
-        for table in tables:
-            import_lines.append(f"from routes.{table}_routes import router as {table}_router")
-            include_lines.append(f"app.include_router({table}_router, prefix='/api/{table}', tags=['{table}'])")
-        
-        return f'''"""
-Generated FastAPI by API Weaver
-Database: {database_type}
-Tables: {', '.join(tables)}
-Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
+        files.update(self._render_tables(tables, render_one))
+        return files
 
-from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from datetime import datetime
-import uvicorn
+    @staticmethod
+    def _write(path: str, data: bytes):
+        """Write a generated source file through a raw file descriptor
 
-app = FastAPI(
-    title="API Weaver Generated API",
-    description="Auto-generated API",
-    version="1.0.0"
-)
+        Contents are already UTF-8 bytes with newlines in place, so the
+        text-IO encoder and buffering layers add nothing; hand the
+        bytes straight to the OS.
+        """
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+    def _write_project_files(self, project_dir: str, files: Dict[str, bytes]):
+        """Write the in-memory project files to disk in one pass"""
+        # project_dir is a directory we just created and the relative
+        # paths are our own '/'-separated arcnames, so plain string
+        # concatenation is safe and skips os.path.join's per-call
+        # separator scanning inside the loop
+        prefix = f'{project_dir}{os.sep}'
+
+        # One makedirs per unique subdirectory, not per file
+        for subdir in {rel_path.rpartition('/')[0] for rel_path in files}:
+            os.makedirs(f'{prefix}{subdir}', exist_ok=True)
+
+        for rel_path, content in files.items():
+            self._write(f'{prefix}{rel_path}', content)
+
+    def _build_zip_buffer(self, files: Dict[str, bytes]) -> BytesIO:
+        """Assemble the project ZIP in memory"""
+        buffer = BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED,
+                             compresslevel=_ZIP_COMPRESSLEVEL) as zipf:
+            for rel_path, content in files.items():
+                if len(content) < _ZIP_STORE_THRESHOLD:
+                    zipf.writestr(rel_path, content,
+                                  compress_type=zipfile.ZIP_STORED)
+                else:
+                    zipf.writestr(rel_path, content)
+        return buffer
+
+    def _cache_project(self, project_id: str, files: Dict[str, bytes]):
+        """Remember a project's rendered files, evicting the oldest"""
+        self._projects[project_id] = files
+        self._projects.move_to_end(project_id)
+        while len(self._projects) > _PROJECT_CACHE_SIZE:
+            self._projects.popitem(last=False)
+
+    def _load_project_from_disk(self, project_id: str) -> Optional[Dict[str, bytes]]:
+        """
+        Reload a project's files from its materialized directory
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+        Generation writes every project under output_dir, so the disk
+        copy outlives cache eviction, process restarts, and serves
+        requests that land on a different worker than the one that
+        generated the project.
+
+        Args:
+            project_id: Identifier returned by generate_api
+
+        Returns:
+            Dict of {relative path: content}, or None if the project
+            directory does not exist
+        """
+        project_dir = os.path.join(self.output_dir, project_id)
+        if not os.path.isdir(project_dir):
+            return None
+
+        files = {}
+        prefix_len = len(project_dir) + len(os.sep)
+        stack = [project_dir]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        rel_path = entry.path[prefix_len:].replace(os.sep, '/')
+                        with open(entry.path, 'rb') as f:
+                            files[rel_path] = f.read()
+        return files
+
+    def stream_zip(self, project_id: str) -> Optional[BytesIO]:
+        """
+        Build a project's ZIP on demand for download
+
+        Args:
+            project_id: Identifier returned by generate_api
+
+        Returns:
+            BytesIO positioned at the start of the archive, or None if
+            the project is unknown
+        """
+        files = self._projects.get(project_id)
+        if files is None:
+            # Cache miss: the project may have been evicted, generated
+            # before a restart, or generated by a sibling worker; fall
+            # back to the directory written at generation time
+            files = self._load_project_from_disk(project_id)
+            if files is None:
+                return None
+            self._cache_project(project_id, files)
+        else:
+            self._projects.move_to_end(project_id)
+        buffer = self._build_zip_buffer(files)
+        buffer.seek(0)
+        return buffer
+
+    def _generate_flask_app_content(self, database_type: str, tables: List[str], include_auth: bool,
+                                    timestamp: str, table_list: str) -> bytes:
+        """Generate Flask app.py content"""
+        return self._render_bytes('flask_app',
+            database_type=database_type,
+            tables=tables,
+            table_list=table_list,
+            table_infos=[self._table_info(t) for t in tables],
+            timestamp=timestamp
+        )
+
+    def _generate_flask_model(self, table_name: str, database_type: str) -> bytes:
+        """Generate Flask model for a table"""
+        return self._render_bytes('flask_model', **self._table_info(table_name))
+
+    def _generate_flask_routes(self, table_name: str) -> bytes:
+        """Generate Flask routes for a table"""
+        return self._render_bytes('flask_routes', **self._table_info(table_name))
 
-@app.get("/")
-async def home():
-    return {{
-        "message": "API Weaver Generated API",
-        "version": "1.0.0",
-        "tables": {tables}
-    }}
-
-@app.get("/health")
-async def health():
-    return {{"status": "healthy", "timestamp": datetime.utcnow().isoformat()}}
-
-# Import and include routers
-{chr(10).join(import_lines)}
-{chr(10).join(include_lines)}
-
-if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
-'''
-    
-    def _generate_fastapi_requirements_content(self, database_type: str) -> str:
+    def _generate_requirements_content(self, database_type: str) -> bytes:
+        """Generate requirements.txt content"""
+        requirements = list(_FLASK_BASE_REQUIREMENTS)
+        if database_type in _DB_REQUIREMENTS:
+            requirements.append(_DB_REQUIREMENTS[database_type])
+        return '\n'.join(requirements).encode('ascii')
+
+    def _generate_fastapi_main_content(self, database_type: str, tables: List[str], include_auth: bool,
+                                       timestamp: str, table_list: str) -> bytes:
+        """Generate FastAPI main.py content"""
+        return self._render_bytes('fastapi_main',
+            database_type=database_type,
+            tables=tables,
+            table_list=table_list,
+            timestamp=timestamp
+        )
+
+    def _generate_fastapi_model(self, table_name: str, database_type: str) -> bytes:
+        """Generate FastAPI (pydantic) model for a table"""
+        return self._render_bytes('fastapi_model', **self._table_info(table_name))
+
+    def _generate_fastapi_requirements_content(self, database_type: str) -> bytes:
         """Generate FastAPI requirements.txt content"""
-        base_requirements = [
-            "fastapi==0.104.1",
-            "uvicorn==0.24.0",
-            "pydantic==2.5.0"
-        ]
-        
-        if database_type == 'mysql':
-            base_requirements.append("PyMySQL==1.1.0")
-        elif database_type == 'mongodb':
-            base_requirements.append("pymongo==4.5.0")
-        
-        return '\n'.join(base_requirements)
-    
-    def _generate_express_app_content(self, database_type: str, tables: List[str], include_auth: bool) -> str:
+        requirements = list(_FASTAPI_BASE_REQUIREMENTS)
+        if database_type in _DB_REQUIREMENTS:
+            requirements.append(_DB_REQUIREMENTS[database_type])
+        return '\n'.join(requirements).encode('ascii')
+
+    def _generate_express_app_content(self, database_type: str, tables: List[str], include_auth: bool,
+                                      timestamp: str, table_list: str) -> bytes:
         """Generate Express.js app.js content"""
-        require_lines = []
-        use_lines = []
-        
-        for table in tables:
-            require_lines.append(f"const {table}Routes = require('./routes/{table}Routes');")
-            use_lines.append(f"app.use('/api/{table}', {table}Routes);")
-        
-        return f'''/**
- * Generated Express.js API by API Weaver
- * Database: {database_type}
- * Tables: {', '.join(tables)}
- * Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
- */
-
-const express = require('express');
-const cors = require('cors');
-const mongoose = require('mongoose');
-
-const app = express();
-const PORT = process.env.PORT || 3000;
-
-// Middleware
-app.use(cors());
-app.use(express.json());
-
-// Routes
-{chr(10).join(require_lines)}
-{chr(10).join(use_lines)}
-
-// Health check
-app.get('/health', (req, res) => {{
-    res.json({{ status: 'healthy', timestamp: new Date().toISOString() }});
-}});
-
-// Home route
-app.get('/', (req, res) => {{
-    res.json({{
-        message: 'API Weaver Generated API',
-        version: '1.0.0',
-        tables: {tables}
-    }});
-}});
-
-// Database connection
-const connectDB = async () => {{
-    try {{
-        const mongoURI = process.env.MONGODB_URI || 'mongodb://localhost:27017/apiweaver';
-        await mongoose.connect(mongoURI);
-        console.log('MongoDB connected');
-    }} catch (error) {{
-        console.error('Database connection error:', error);
-        process.exit(1);
-    }}
-}};
-
-// Start server
-const startServer = async () => {{
-    await connectDB();
-    app.listen(PORT, () => {{
-        console.log(`Server running on port ${{PORT}}`);
-    }});
-}};
-
-startServer();
-
-module.exports = app;
-'''
-    
-    def _generate_package_json_content(self, database_type: str) -> str:
+        return self._render_bytes('express_app',
+            database_type=database_type,
+            tables=tables,
+            table_list=table_list,
+            table_infos=[self._table_info(t) for t in tables],
+            timestamp=timestamp
+        )
+
+    def _generate_express_model(self, table_name: str, database_type: str) -> bytes:
+        """Generate Express.js (mongoose) model for a table"""
+        return self._render_bytes('express_model', **self._table_info(table_name))
+
+    def _generate_express_routes(self, table_name: str) -> bytes:
+        """Generate Express.js routes for a table"""
+        return self._render_bytes('express_routes', **self._table_info(table_name))
+
+    def _generate_package_json_content(self, database_type: str) -> bytes:
         """Generate package.json content"""
-        return '''{
-  "name": "api-weaver-generated-api",
-  "version": "1.0.0",
-  "description": "Auto-generated API by API Weaver",
-  "main": "app.js",
-  "scripts": {
-    "start": "node app.js",
-    "dev": "nodemon app.js"
-  },
-  "dependencies": {
-    "express": "^4.18.2",
-    "cors": "^2.8.5",
-    "mongoose": "^7.5.0",
-    "dotenv": "^16.3.1"
-  },
-  "devDependencies": {
-    "nodemon": "^3.0.1"
-  },
-  "keywords": ["api", "generated", "api-weaver"],
-  "author": "API Weaver",
-  "license": "MIT"
-}'''
-    
-    def _generate_readme_content(self, framework: str, database_type: str, tables: List[str]) -> str:
+        return _PACKAGE_JSON
+
+    def _generate_readme_content(self, framework: str, database_type: str, tables: List[str],
+                                 timestamp: str, table_list: str) -> bytes:
         """Generate README.md content"""
         port = "5000" if framework == 'Flask' else "8000" if framework == 'FastAPI' else "3000"
         install_cmd = "pip install -r requirements.txt" if framework in ['Flask', 'FastAPI'] else "npm install"
         run_cmd = "python app.py" if framework == 'Flask' else "python main.py" if framework == 'FastAPI' else "npm start"
-        
-        endpoint_lines = []
-        for table in tables:
-            endpoint_lines.append(f"### {table.title()}\n- GET /api/{table} - List all {table}\n- GET /api/{table}/{{id}} - Get {table} by ID\n- POST /api/{table} - Create {table}\n- PUT /api/{table}/{{id}} - Update {table}\n- DELETE /api/{table}/{{id}} - Delete {table}")
-        
-        return f'''# Generated API by API Weaver
-
-## Framework: {framework}
-## Database: {database_type}
-## Tables: {', '.join(tables)}
-
-## Quick Start
-
-### Installation
-```bash
-{install_cmd}
-```
-
-### Running the API
-```bash
-{run_cmd}
-```
-
-## API Endpoints
-
-{chr(10).join(endpoint_lines)}
-
-## Documentation
-- Swagger UI: http://localhost:{port}/docs
-- Health Check: http://localhost:{port}/health
-
-## Generated by API Weaver
-Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-'''
-    
-    def _create_zip_file(self, source_dir: str, zip_path: str):
-        """Create ZIP file from directory"""
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(source_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    arcname = os.path.relpath(file_path, source_dir)
-                    zipf.write(file_path, arcname)
+
+        endpoints = '\n\n'.join(
+            _README_ENDPOINTS_TMPL.format(title=t.title(), t=t) for t in tables
+        )
+
+        return self._render_bytes('readme',
+            framework=framework,
+            database_type=database_type,
+            endpoints=endpoints,
+            table_list=table_list,
+            port=port,
+            install_cmd=install_cmd,
+            run_cmd=run_cmd,
+            timestamp=timestamp
+        )
+
@@ -188,6 +188,10 @@ class APIGenerator:
             import_lines.append(f"from models.{table} import {table.title().replace('_', '')}")
             blueprint_lines.append(f"from routes.{table}_routes import {table}_bp")
             register_lines.append(f"app.register_blueprint({table}_bp, url_prefix='/api/{table}')")
+
+        imports_block = '\n'.join(import_lines)
+        blueprints_block = '\n'.join(blueprint_lines)
+        registers_block = '\n'.join(register_lines)
         
         return f'''"""
 Generated Flask API by API Weaver
@@ -211,13 +215,13 @@ CORS(app)
 db = SQLAlchemy(app)
 
 # Import models
-{chr(10).join(import_lines)}
+{imports_block}
 
 # Import routes
-{chr(10).join(blueprint_lines)}
+{blueprints_block}
 
 # Register blueprints
-{chr(10).join(register_lines)}
+{registers_block}
 
 @app.route('/')
 def home():
@@ -366,6 +370,9 @@ def delete_{table_name}(id):
         for table in tables:
             import_lines.append(f"from routes.{table}_routes import router as {table}_router")
             include_lines.append(f"app.include_router({table}_router, prefix='/api/{table}', tags=['{table}'])")
+
+        imports_block = '\n'.join(import_lines)
+        includes_block = '\n'.join(include_lines)
         
         return f'''"""
 Generated FastAPI by API Weaver
@@ -408,8 +415,8 @@ async def health():
     return {{"status": "healthy", "timestamp": datetime.utcnow().isoformat()}}
 
 # Import and include routers
-{chr(10).join(import_lines)}
-{chr(10).join(include_lines)}
+{imports_block}
+{includes_block}
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -438,6 +445,9 @@ if __name__ == "__main__":
         for table in tables:
             require_lines.append(f"const {table}Routes = require('./routes/{table}Routes');")
             use_lines.append(f"app.use('/api/{table}', {table}Routes);")
+
+        requires_block = '\n'.join(require_lines)
+        uses_block = '\n'.join(use_lines)
         
         return f'''/**
  * Generated Express.js API by API Weaver
@@ -458,8 +468,8 @@ app.use(cors());
 app.use(express.json());
 
 // Routes
-{chr(10).join(require_lines)}
-{chr(10).join(use_lines)}
+{requires_block}
+{uses_block}
 
 // Health check
 app.get('/health', (req, res) => {{
@@ -534,6 +544,8 @@ module.exports = app;
         endpoint_lines = []
         for table in tables:
             endpoint_lines.append(f"### {table.title()}\n- GET /api/{table} - List all {table}\n- GET /api/{table}/{{id}} - Get {table} by ID\n- POST /api/{table} - Create {table}\n- PUT /api/{table}/{{id}} - Update {table}\n- DELETE /api/{table}/{{id}} - Delete {table}")
+
+        endpoints_block = '\n'.join(endpoint_lines)
         
         return f'''# Generated API by API Weaver
 
@@ -555,7 +567,7 @@ module.exports = app;
 
 ## API Endpoints
 
-{chr(10).join(endpoint_lines)}
+{endpoints_block}
 
 ## Documentation
 - Swagger UI: http://localhost:{port}/docs
@@ -0,0 +1,433 @@
+"""
+Precompiled Jinja2 Templates for API Weaver
+Template sources live here and are parsed once at import time, so the
+generators render against compiled template objects instead of
+rebuilding interpolated strings on every call
+"""
+
+from jinja2 import Environment, DictLoader
+
+_FLASK_APP = '''"""
+Generated Flask API by API Weaver
+Database: {{ database_type }}
+Tables: {{ table_list }}
+Generated on: {{ timestamp }}
+"""
+
+from flask import Flask, request, jsonify
+from flask_cors import CORS
+from datetime import datetime
+import os
+
+from models import db
+
+app = Flask(__name__)
+app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///app.db')
+app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+# Initialize extensions
+CORS(app)
+db.init_app(app)
+
+# Import models
+{% for t in table_infos %}
+from models.{{ t.name }} import {{ t.class_name }}
+{% endfor %}
+
+# Import routes
+{% for t in table_infos %}
+from routes.{{ t.name }}_routes import {{ t.name }}_bp
+{% endfor %}
+
+# Register blueprints
+{% for t in table_infos %}
+app.register_blueprint({{ t.name }}_bp, url_prefix='/api/{{ t.name }}')
+{% endfor %}
+
+@app.route('/')
+def home():
+    return jsonify({
+        "message": "API Weaver Generated API",
+        "version": "1.0.0",
+        "tables": {{ tables }},
+        "docs": "/docs"
+    })
+
+@app.route('/health')
+def health():
+    return jsonify({"status": "healthy", "timestamp": datetime.utcnow().isoformat()})
+
+if __name__ == '__main__':
+    with app.app_context():
+        db.create_all()
+    app.run(debug=True, host='0.0.0.0', port=5000)
+'''
+
+_FLASK_MODEL = '''"""
+{{ title }} Model
+Generated by API Weaver
+"""
+
+from datetime import datetime
+
+from models import db
+
+class {{ class_name }}(db.Model):
+    """{{ title }} model"""
+
+    __tablename__ = '{{ name }}'
+
+    id = db.Column(db.Integer, primary_key=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def to_dict(self):
+        """Convert to dictionary"""
+        return {
+            'id': self.id,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+    def __repr__(self):
+        return f'<{{ class_name }} {self.id}>'
+'''
+
+_FLASK_ROUTES = '''"""
+{{ title }} Routes
+Generated by API Weaver
+"""
+
+from flask import Blueprint, request, jsonify
+from models import db
+from models.{{ name }} import {{ class_name }}
+
+{{ name }}_bp = Blueprint('{{ name }}', __name__)
+
+@{{ name }}_bp.route('/', methods=['GET'])
+def get_{{ name }}():
+    """Get all {{ name }}"""
+    try:
+        {{ name }} = {{ class_name }}.query.all()
+        return jsonify([item.to_dict() for item in {{ name }}])
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@{{ name }}_bp.route('/<int:id>', methods=['GET'])
+def get_{{ name }}_by_id(id):
+    """Get {{ name }} by ID"""
+    try:
+        {{ name }} = {{ class_name }}.query.get_or_404(id)
+        return jsonify({{ name }}.to_dict())
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@{{ name }}_bp.route('/', methods=['POST'])
+def create_{{ name }}():
+    """Create new {{ name }}"""
+    try:
+        data = request.get_json()
+        {{ name }} = {{ class_name }}(**data)
+        db.session.add({{ name }})
+        db.session.commit()
+        return jsonify({{ name }}.to_dict()), 201
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@{{ name }}_bp.route('/<int:id>', methods=['PUT'])
+def update_{{ name }}(id):
+    """Update {{ name }}"""
+    try:
+        {{ name }} = {{ class_name }}.query.get_or_404(id)
+        data = request.get_json()
+        for key, value in data.items():
+            setattr({{ name }}, key, value)
+        db.session.commit()
+        return jsonify({{ name }}.to_dict())
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@{{ name }}_bp.route('/<int:id>', methods=['DELETE'])
+def delete_{{ name }}(id):
+    """Delete {{ name }}"""
+    try:
+        {{ name }} = {{ class_name }}.query.get_or_404(id)
+        db.session.delete({{ name }})
+        db.session.commit()
+        return jsonify({'message': 'Deleted successfully'})
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+'''
+
+# Shared db instance for generated Flask projects; model modules import
+# it instead of each instantiating their own SQLAlchemy()
+FLASK_MODELS_INIT = '''"""
+Models package
+Generated by API Weaver
+"""
+
+from flask_sqlalchemy import SQLAlchemy
+
+db = SQLAlchemy()
+'''
+
+_FASTAPI_MAIN = '''"""
+Generated FastAPI by API Weaver
+Database: {{ database_type }}
+Tables: {{ table_list }}
+Generated on: {{ timestamp }}
+"""
+
+from fastapi import FastAPI, HTTPException
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from datetime import datetime
+import uvicorn
+
+app = FastAPI(
+    title="API Weaver Generated API",
+    description="Auto-generated API",
+    version="1.0.0"
+)
+
+# Add CORS middleware
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+@app.get("/")
+async def home():
+    return {
+        "message": "API Weaver Generated API",
+        "version": "1.0.0",
+        "tables": {{ tables }}
+    }
+
+@app.get("/health")
+async def health():
+    return {"status": "healthy", "timestamp": datetime.utcnow().isoformat()}
+
+if __name__ == "__main__":
+    uvicorn.run(app, host="0.0.0.0", port=8000)
+'''
+
+_FASTAPI_MODEL = '''"""
+{{ title }} Model
+Generated by API Weaver
+"""
+
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+class {{ class_name }}(BaseModel):
+    """{{ title }} model"""
+
+    id: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+'''
+
+_EXPRESS_APP = '''/**
+ * Generated Express.js API by API Weaver
+ * Database: {{ database_type }}
+ * Tables: {{ table_list }}
+ * Generated on: {{ timestamp }}
+ */
+
+const express = require('express');
+const cors = require('cors');
+const mongoose = require('mongoose');
+
+const app = express();
+const PORT = process.env.PORT || 3000;
+
+// Middleware
+app.use(cors());
+app.use(express.json());
+
+// Routes
+{% for t in table_infos %}
+const {{ t.name }}Routes = require('./routes/{{ t.name }}Routes');
+{% endfor %}
+{% for t in table_infos %}
+app.use('/api/{{ t.name }}', {{ t.name }}Routes);
+{% endfor %}
+
+// Health check
+app.get('/health', (req, res) => {
+    res.json({ status: 'healthy', timestamp: new Date().toISOString() });
+});
+
+// Home route
+app.get('/', (req, res) => {
+    res.json({
+        message: 'API Weaver Generated API',
+        version: '1.0.0',
+        tables: {{ tables }}
+    });
+});
+
+// Database connection
+const connectDB = async () => {
+    try {
+        const mongoURI = process.env.MONGODB_URI || 'mongodb://localhost:27017/apiweaver';
+        await mongoose.connect(mongoURI);
+        console.log('MongoDB connected');
+    } catch (error) {
+        console.error('Database connection error:', error);
+        process.exit(1);
+    }
+};
+
+// Start server
+const startServer = async () => {
+    await connectDB();
+    app.listen(PORT, () => {
+        console.log(`Server running on port ${PORT}`);
+    });
+};
+
+startServer();
+
+module.exports = app;
+'''
+
+_EXPRESS_MODEL = '''/**
+ * {{ title }} Model
+ * Generated by API Weaver
+ */
+
+const mongoose = require('mongoose');
+
+const {{ name }}Schema = new mongoose.Schema({}, {
+    strict: false,
+    timestamps: true,
+    collection: '{{ name }}'
+});
+
+module.exports = mongoose.model('{{ class_name }}', {{ name }}Schema);
+'''
+
+_EXPRESS_ROUTES = '''/**
+ * {{ title }} Routes
+ * Generated by API Weaver
+ */
+
+const express = require('express');
+const router = express.Router();
+const {{ class_name }} = require('../models/{{ name }}');
+
+router.get('/', async (req, res) => {
+    try {
+        const items = await {{ class_name }}.find();
+        res.json(items);
+    } catch (error) {
+        res.status(500).json({ error: error.message });
+    }
+});
+
+router.get('/:id', async (req, res) => {
+    try {
+        const item = await {{ class_name }}.findById(req.params.id);
+        if (!item) return res.status(404).json({ error: 'Not found' });
+        res.json(item);
+    } catch (error) {
+        res.status(500).json({ error: error.message });
+    }
+});
+
+router.post('/', async (req, res) => {
+    try {
+        const item = await {{ class_name }}.create(req.body);
+        res.status(201).json(item);
+    } catch (error) {
+        res.status(500).json({ error: error.message });
+    }
+});
+
+router.put('/:id', async (req, res) => {
+    try {
+        const item = await {{ class_name }}.findByIdAndUpdate(req.params.id, req.body, { new: true });
+        if (!item) return res.status(404).json({ error: 'Not found' });
+        res.json(item);
+    } catch (error) {
+        res.status(500).json({ error: error.message });
+    }
+});
+
+router.delete('/:id', async (req, res) => {
+    try {
+        const item = await {{ class_name }}.findByIdAndDelete(req.params.id);
+        if (!item) return res.status(404).json({ error: 'Not found' });
+        res.json({ message: 'Deleted successfully' });
+    } catch (error) {
+        res.status(500).json({ error: error.message });
+    }
+});
+
+module.exports = router;
+'''
+
+_README = '''# Generated API by API Weaver
+
+## Framework: {{ framework }}
+## Database: {{ database_type }}
+## Tables: {{ table_list }}
+
+## Quick Start
+
+### Installation
+```bash
+{{ install_cmd }}
+```
+
+### Running the API
+```bash
+{{ run_cmd }}
+```
+
+## API Endpoints
+
+{{ endpoints }}
+
+## Documentation
+- Swagger UI: http://localhost:{{ port }}/docs
+- Health Check: http://localhost:{{ port }}/health
+
+## Generated by API Weaver
+Generated on: {{ timestamp }}
+'''
+
+_TEMPLATE_SOURCES = {
+    'flask_app': _FLASK_APP,
+    'flask_model': _FLASK_MODEL,
+    'flask_routes': _FLASK_ROUTES,
+    'fastapi_main': _FASTAPI_MAIN,
+    'fastapi_model': _FASTAPI_MODEL,
+    'express_app': _EXPRESS_APP,
+    'express_model': _EXPRESS_MODEL,
+    'express_routes': _EXPRESS_ROUTES,
+    'readme': _README,
+}
+
+env = Environment(
+    loader=DictLoader(_TEMPLATE_SOURCES),
+    trim_blocks=True,
+    lstrip_blocks=True,
+    keep_trailing_newline=True,
+    auto_reload=False
+)
+
+# Force compilation now so no request pays the parse cost
+TEMPLATES = {name: env.get_template(name) for name in _TEMPLATE_SOURCES}
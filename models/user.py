@@ -1,10 +1,17 @@
 from flask_sqlalchemy import SQLAlchemy
-from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.security import check_password_hash
 from datetime import datetime
+import bcrypt
+import os
 import uuid
 
 db = SQLAlchemy()
 
+# bcrypt at 10 rounds costs a fraction of werkzeug's default pbkdf2
+# (260k iterations) per login while staying a deliberately slow hash;
+# raise via env if the deployment can afford it
+_BCRYPT_ROUNDS = int(os.environ.get('BCRYPT_ROUNDS', 10))
+
 class User(db.Model):
     __tablename__ = 'users'
     
@@ -24,9 +31,18 @@ class User(db.Model):
         self.role = role
     
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
-    
+        self.password_hash = bcrypt.hashpw(
+            password.encode('utf-8'),
+            bcrypt.gensalt(rounds=_BCRYPT_ROUNDS)
+        ).decode('ascii')
+
     def check_password(self, password):
+        if self.password_hash.startswith('$2'):
+            return bcrypt.checkpw(
+                password.encode('utf-8'),
+                self.password_hash.encode('ascii')
+            )
+        # Legacy werkzeug pbkdf2 hashes from before the bcrypt switch
         return check_password_hash(self.password_hash, password)
     
     def to_dict(self):
@@ -20,17 +20,26 @@ def main():
     print("📍 Backend: http://localhost:5000")
     print("📍 Frontend: http://localhost:3000")
     print("📍 API Docs: http://localhost:5000/api/docs")
-    
+
     # Create database tables
     create_tables()
-    
-    # Start the application
-    app.run(
-        debug=True,
-        host='0.0.0.0',
-        port=5000,
-        threaded=True
-    )
+
+    if os.environ.get('APIWEAVER_DEV') == '1':
+        # Debug server: single process, reloader, debugger middleware —
+        # opt in explicitly for development only
+        app.run(
+            debug=True,
+            host='0.0.0.0',
+            port=5000,
+            threaded=True
+        )
+    else:
+        # Serve with one gunicorn worker per core; the Werkzeug dev
+        # server is single-process and GIL-bound
+        workers = str(os.cpu_count() or 2)
+        os.execvp('gunicorn', [
+            'gunicorn', '-w', workers, '-b', '0.0.0.0:5000', 'app:app'
+        ])
 
 if __name__ == '__main__':
     main()
@@ -12,12 +12,14 @@ def run_command(command, description):
     """Run a command and handle errors"""
     print(f"🔄 {description}...")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        subprocess.run(command, shell=True, check=True, capture_output=True)
         print(f"✅ {description} completed successfully")
         return True
     except subprocess.CalledProcessError as e:
+        # Output is captured as bytes and only decoded on failure;
+        # success output was decoded and thrown away before
         print(f"❌ {description} failed: {e}")
-        print(f"Error: {e.stderr}")
+        print(f"Error: {e.stderr.decode(errors='replace')}")
         return False
 
 def check_python_version():
@@ -27,18 +29,14 @@ def check_python_version():
         sys.exit(1)
     print(f"✅ Python {sys.version.split()[0]} detected")
 
-def install_python_dependencies():
-    """Install Python dependencies"""
-    return run_command("pip install -r requirements.txt", "Installing Python dependencies")
-
-def install_node_dependencies():
-    """Install Node.js dependencies"""
+def install_dependencies():
+    """Install Python and Node.js dependencies in one shell invocation"""
+    commands = ["pip install -r requirements.txt"]
     if os.path.exists("frontend"):
-        os.chdir("frontend")
-        success = run_command("npm install", "Installing Node.js dependencies")
-        os.chdir("..")
-        return success
-    return True
+        # npm --prefix avoids the chdir dance and lets both installs
+        # run as a single chained shell command
+        commands.append("npm --prefix frontend install")
+    return run_command(" && ".join(commands), "Installing dependencies")
 
 def setup_database():
     """Setup database"""
@@ -62,12 +60,8 @@ def main():
     check_python_version()
     
     # Install dependencies
-    if not install_python_dependencies():
-        print("❌ Setup failed at Python dependencies")
-        sys.exit(1)
-    
-    if not install_node_dependencies():
-        print("❌ Setup failed at Node.js dependencies")
+    if not install_dependencies():
+        print("❌ Setup failed at dependency installation")
         sys.exit(1)
     
     # Setup database
@@ -3,56 +3,308 @@ Export Manager for API Weaver
 Handles project export and deployment
 """
 
+import io
+import json
+import mmap
 import os
 import shutil
 import zipfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    # Intel ISA-L's zlib-compatible deflate and CRC32 (SIMD-backed) are
+    # several times faster on x86_64; pointing zipfile at it also
+    # speeds up the compressor inside zipf.write. Falls back silently
+    # to stdlib zlib when python-isal isn't installed.
+    from isal import isal_zlib as zlib
+    zipfile.zlib = zlib
+except ImportError:
+    import zlib
 from typing import Dict, Any
-from datetime import datetime
-import uuid
+
+from cachetools import TTLCache
+
+# Exports are dominated by deflate CPU: level 1 gets most of the size
+# win at a fraction of the cost, and already-compressed payloads are
+# stored as-is instead of being run through deflate for nothing
+_ZIP_COMPRESSLEVEL = 1
+_STORED_EXTENSIONS = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.zip', '.gz', '.whl', '.pdf'
+})
+
+
+def _compress_type(arcname: str) -> int:
+    """Pick the ZIP compression method for an archive entry"""
+    ext = os.path.splitext(arcname)[1].lower()
+    return zipfile.ZIP_STORED if ext in _STORED_EXTENSIONS else zipfile.ZIP_DEFLATED
+
+
+# Below this many files the pool's fixed cost beats the parallelism
+_PARALLEL_ZIP_THRESHOLD = 8
+
+# Entries at least this large get ZIP64 headers up front. The streamed
+# archive is forward-only — there is no seeking back to patch a local
+# header that turned out to need ZIP64 — so the decision must be made
+# before the entry is written.
+_ZIP64_THRESHOLD = 1 << 31
+
+# Export-then-deploy flows stat the same project directory within
+# seconds; a short-lived cache answers the repeats without a syscall
+_exists_cache = TTLCache(maxsize=256, ttl=2)
+
+# Finished export results remembered per project; oldest fall out first
+_EXPORT_CACHE_SIZE = 128
+
+# Finished job futures kept around for status polling; beyond this the
+# completed ones are dropped (their archives live on disk anyway)
+_EXPORT_JOBS_MAX = 256
+
+# Deflate work runs here instead of on request threads, so a large
+# export never pins a web worker for its whole duration
+_export_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 2)
+
+# Deployment artifacts are constant apart from the timestamp in the
+# local script; built once at import instead of per deploy call
+_LOCAL_DEPLOY_TEMPLATE = '''#!/bin/bash
+
+# API Weaver Local Deployment Script
+# Generated on: {ts}
+
+echo "🚀 Starting API Weaver Local Deployment..."
+
+# Check if Python is installed
+if ! command -v python3 &> /dev/null; then
+    echo "❌ Python3 is not installed. Please install Python3 first."
+    exit 1
+fi
+
+# Check if pip is installed
+if ! command -v pip3 &> /dev/null; then
+    echo "❌ pip3 is not installed. Please install pip3 first."
+    exit 1
+fi
+
+# Install dependencies
+echo "📦 Installing dependencies..."
+pip3 install -r requirements.txt
+
+# Set environment variables
+export FLASK_APP=app.py
+export FLASK_ENV=development
+
+# Start the application
+echo "🌟 Starting API Weaver..."
+echo "📍 API will be available at: http://localhost:5000"
+echo "📚 Documentation: http://localhost:5000/docs"
+echo "🔍 Health Check: http://localhost:5000/health"
+
+python3 app.py
+'''
+
+_PROCFILE = b"web: gunicorn app:app"
+
+_RUNTIME = b"python-3.11.0"
+
+_HEROKU_APP_JSON = json.dumps({
+    "name": "API Weaver Generated API",
+    "description": "Auto-generated API by API Weaver",
+    "repository": "https://github.com/api-weaver/generated-api",
+    "logo": "https://api-weaver.com/logo.png",
+    "keywords": ["api", "generated", "api-weaver"],
+    "success_url": "/",
+    "env": {
+        "FLASK_ENV": {
+            "description": "Flask environment",
+            "value": "production"
+        }
+    }
+}, indent=2).encode('utf-8')
+
+_RENDER_YAML = b'''services:
+  - type: web
+    name: api-weaver-generated-api
+    env: python
+    buildCommand: pip install -r requirements.txt
+    startCommand: gunicorn app:app
+    envVars:
+      - key: FLASK_ENV
+        value: production
+    healthCheckPath: /health
+'''
+
+
+# Targets with in-archive artifacts; also used to split an async job id
+# back into its (project id, target) parts
+_DEPLOYMENT_TARGETS = ('heroku', 'render')
+
+
+def _deployment_artifacts(deployment_target: str) -> Dict[str, Any]:
+    """In-memory deployment files for a target, empty when unknown"""
+    if deployment_target == 'heroku':
+        return {
+            'Procfile': _PROCFILE,
+            'runtime.txt': _RUNTIME,
+            'app.json': _HEROKU_APP_JSON
+        }
+    if deployment_target == 'render':
+        return {'render.yaml': _RENDER_YAML}
+    return {}
+
+
+def _deflate_entry(job):
+    """Compress one file into a ready-to-write ZIP entry
+
+    Runs on a worker thread; zlib releases the GIL during crc32 and
+    compress, so entries really deflate in parallel. Raw deflate
+    (wbits=-15) matches what a ZIP member stores.
+    """
+    file_path, arcname = job
+    zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+    zinfo.compress_type = _compress_type(arcname)
+
+    if zinfo.file_size == 0:
+        # mmap refuses empty files
+        zinfo.CRC = 0
+        zinfo.compress_size = 0
+        return zinfo, b''
+
+    # Map the file once and feed the same buffer to both crc32 and the
+    # compressor — no userspace copy of the input bytes
+    with open(file_path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        zinfo.CRC = zlib.crc32(mm)
+        if zinfo.compress_type == zipfile.ZIP_DEFLATED:
+            compressor = zlib.compressobj(_ZIP_COMPRESSLEVEL, zlib.DEFLATED, -15)
+            data = compressor.compress(mm) + compressor.flush()
+        else:
+            data = bytes(mm)
+    zinfo.compress_size = len(data)
+    return zinfo, data
+
+
+class _ChunkStream(io.RawIOBase):
+    """Unseekable in-memory sink that hands written chunks to a consumer
+
+    zipfile writes the archive into this object and the export route
+    drains the chunks into the HTTP response as they appear, so the
+    client starts receiving bytes after the first entry instead of
+    after the whole archive is finished
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        chunk = bytes(b)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self):
+        return self._position
+
+    def drain(self):
+        """Yield and forget everything written since the last drain"""
+        chunks, self._chunks = self._chunks, []
+        yield from chunks
+
 
 class ExportManager:
     """Export manager for generated API projects"""
     
     def __init__(self):
         self.export_dir = "generated_apis"
+        # Export results keyed by project id with the tree fingerprint
+        # they were built from; unchanged projects reuse their archive
+        self._export_cache: 'OrderedDict[str, tuple]' = OrderedDict()
+        # In-flight and finished async export jobs by job id
+        self._export_jobs: Dict[str, Any] = {}
         self.ensure_export_dir()
     
     def ensure_export_dir(self):
         """Ensure export directory exists"""
         if not os.path.exists(self.export_dir):
             os.makedirs(self.export_dir)
+
+    @staticmethod
+    def _project_exists(project_path: str) -> bool:
+        """Check a project directory exists, caching the stat briefly"""
+        cached = _exists_cache.get(project_path)
+        if cached is not None:
+            return cached
+
+        try:
+            os.stat(project_path)
+            exists = True
+        except FileNotFoundError:
+            exists = False
+        _exists_cache[project_path] = exists
+        return exists
     
-    def export_project(self, project_id: str) -> Dict[str, Any]:
+    def export_project(self, project_id: str,
+                       deployment_target: str = None) -> Dict[str, Any]:
         """
         Export a generated project
-        
+
         Args:
             project_id: ID of the project to export
-            
+            deployment_target: Optional target (heroku, render) whose
+                deployment artifacts are injected into the archive
+                in memory, without touching the project directory
+
         Returns:
             Dict: Export result with download information
         """
         try:
             project_path = os.path.join(self.export_dir, project_id)
-            
-            if not os.path.exists(project_path):
+
+            if not self._project_exists(project_path):
                 return {
                     'status': 'error',
                     'message': 'Project not found'
                 }
-            
-            # Create ZIP file
-            zip_filename = f"{project_id}.zip"
+
+            if deployment_target:
+                zip_filename = f"{project_id}-{deployment_target}.zip"
+            else:
+                zip_filename = f"{project_id}.zip"
             zip_path = os.path.join(self.export_dir, zip_filename)
-            
-            self._create_zip_file(project_path, zip_path)
-            
-            return {
+
+            # An unchanged tree produces an identical archive; compare
+            # fingerprints and skip the whole deflate pass on a hit
+            cache_key = (project_id, deployment_target)
+            fingerprint = self._fingerprint(project_path)
+            cached = self._export_cache.get(cache_key)
+            if cached and cached[0] == fingerprint and os.path.exists(zip_path):
+                self._export_cache.move_to_end(cache_key)
+                return cached[1]
+
+            # The fingerprint pass already totalled the tree's bytes;
+            # hand that to the zip writer so it doesn't re-stat every
+            # file to size its preallocation
+            size = self._create_zip_file(
+                project_path, zip_path,
+                extra_files=_deployment_artifacts(deployment_target),
+                total_bytes=fingerprint[2]
+            )
+
+            result = {
                 'status': 'success',
                 'download_url': f'/download/{zip_filename}',
                 'filename': zip_filename,
-                'size': os.path.getsize(zip_path)
+                'size': size
             }
+            self._export_cache[cache_key] = (fingerprint, result)
+            self._export_cache.move_to_end(cache_key)
+            while len(self._export_cache) > _EXPORT_CACHE_SIZE:
+                self._export_cache.popitem(last=False)
+            return result
             
         except Exception as e:
             return {
@@ -60,6 +312,124 @@ class ExportManager:
                 'message': f'Export failed: {str(e)}'
             }
     
+    def export_project_async(self, project_id: str,
+                             deployment_target: str = None) -> Dict[str, Any]:
+        """
+        Queue an export on the worker pool instead of the request thread
+
+        Args:
+            project_id: ID of the project to export
+            deployment_target: Optional target passed to export_project
+
+        Returns:
+            Dict: Pending-job response with the status URL to poll
+        """
+        project_path = os.path.join(self.export_dir, project_id)
+        if not self._project_exists(project_path):
+            return {
+                'status': 'error',
+                'message': 'Project not found'
+            }
+
+        if deployment_target:
+            job_id = f'{project_id}-{deployment_target}'
+        else:
+            job_id = project_id
+
+        # Re-submitting a finished job restarts it (the fingerprint
+        # cache makes an unchanged rebuild cheap); a running job is
+        # reused rather than duplicated
+        future = self._export_jobs.get(job_id)
+        if future is None or future.done():
+            self._export_jobs[job_id] = _export_pool.submit(
+                self.export_project, project_id, deployment_target
+            )
+
+        # Keep the job table bounded: completed futures are only held
+        # for polling convenience, so shed the excess ones
+        if len(self._export_jobs) > _EXPORT_JOBS_MAX:
+            for done_id in [jid for jid, f in self._export_jobs.items()
+                            if jid != job_id and f.done()]:
+                del self._export_jobs[done_id]
+
+        return {
+            'status': 'pending',
+            'job_id': job_id,
+            'status_url': f'/api/export/status/{job_id}'
+        }
+
+    def export_status(self, job_id: str) -> Dict[str, Any]:
+        """
+        Report the state of an async export job
+
+        Args:
+            job_id: Identifier returned by export_project_async
+
+        Returns:
+            Dict: Pending marker, the finished export result, or an
+            error for unknown jobs
+        """
+        future = self._export_jobs.get(job_id)
+        if future is None:
+            return self._status_from_disk(job_id)
+        if not future.done():
+            return {
+                'status': 'pending',
+                'job_id': job_id
+            }
+        try:
+            return future.result()
+        except Exception as e:
+            return {
+                'status': 'error',
+                'message': f'Export failed: {str(e)}'
+            }
+
+    def _status_from_disk(self, job_id: str) -> Dict[str, Any]:
+        """
+        Answer a status poll for a job this process never saw
+
+        Under gunicorn each worker has its own job table, so the poll
+        may land on a different worker than the submit (or on a
+        restarted one). The archive name is the job id, so a finished
+        job is visible on disk regardless of which worker built it.
+
+        Args:
+            job_id: Identifier returned by export_project_async
+
+        Returns:
+            Dict: The finished result, a pending marker while a sibling
+            worker is still building, or an error for unknown jobs
+        """
+        zip_filename = f'{job_id}.zip'
+        try:
+            size = os.stat(os.path.join(self.export_dir, zip_filename)).st_size
+            return {
+                'status': 'success',
+                'download_url': f'/download/{zip_filename}',
+                'filename': zip_filename,
+                'size': size
+            }
+        except FileNotFoundError:
+            pass
+
+        # No archive yet: if the project itself exists the job is
+        # plausibly still running on another worker
+        project_id = job_id
+        for target in _DEPLOYMENT_TARGETS:
+            if job_id.endswith(f'-{target}'):
+                project_id = job_id[:-len(target) - 1]
+                break
+        if self._project_exists(os.path.join(self.export_dir, project_id)):
+            return {
+                'status': 'pending',
+                'job_id': job_id
+            }
+        return {
+            'status': 'error',
+            'message': 'Unknown export job'
+        }
+
     def deploy_project(self, project_id: str, deployment_target: str = 'local') -> Dict[str, Any]:
         """
         Deploy a project to specified target
@@ -73,8 +443,8 @@ class ExportManager:
         """
         try:
             project_path = os.path.join(self.export_dir, project_id)
-            
-            if not os.path.exists(project_path):
+
+            if not self._project_exists(project_path):
                 return {
                     'status': 'error',
                     'message': 'Project not found'
@@ -98,25 +468,188 @@ class ExportManager:
                 'message': f'Deployment failed: {str(e)}'
             }
     
-    def _create_zip_file(self, source_dir: str, zip_path: str):
-        """Create ZIP file from directory"""
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(source_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    arcname = os.path.relpath(file_path, source_dir)
-                    zipf.write(file_path, arcname)
+    def stream_export(self, project_id: str):
+        """
+        Stream a project's ZIP archive as it is built
+
+        Args:
+            project_id: ID of the project to export
+
+        Returns:
+            Generator yielding archive byte chunks, or None if the
+            project does not exist
+        """
+        project_path = os.path.join(self.export_dir, project_id)
+        if not self._project_exists(project_path):
+            return None
+
+        def generate():
+            sink = _ChunkStream()
+            with zipfile.ZipFile(sink, 'w', zipfile.ZIP_DEFLATED,
+                                 compresslevel=_ZIP_COMPRESSLEVEL,
+                                 allowZip64=True) as zipf:
+                for file_path, arcname in self._iter_project_files(project_path):
+                    if os.stat(file_path).st_size >= _ZIP64_THRESHOLD:
+                        zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+                        zinfo.compress_type = _compress_type(arcname)
+                        with open(file_path, 'rb') as src, \
+                                zipf.open(zinfo, 'w', force_zip64=True) as dest:
+                            shutil.copyfileobj(src, dest, 1 << 20)
+                    else:
+                        zipf.write(file_path, arcname,
+                                   compress_type=_compress_type(arcname))
+                    yield from sink.drain()
+            # Central directory written on close
+            yield from sink.drain()
+
+        return generate()
+
+    @staticmethod
+    def _fingerprint(path: str):
+        """Cheap tree signature: newest mtime, file count, total bytes
+
+        One scandir pass — orders of magnitude cheaper than deflating
+        the tree — that changes whenever any file is touched, added,
+        or removed
+        """
+        newest = 0
+        count = 0
+        total = 0
+        stack = [path]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    st = entry.stat(follow_symlinks=False)
+                    if st.st_mtime_ns > newest:
+                        newest = st.st_mtime_ns
+                    count += 1
+                    total += st.st_size
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        return newest, count, total
+
+    @staticmethod
+    def _iter_project_files(source_dir: str):
+        """Yield (absolute path, archive name) for every project file
+
+        Walks with os.scandir so each entry's type comes from the
+        directory listing itself (dirent d_type) instead of a stat
+        call per file, which os.walk used to pay
+        """
+        # entry.path is source_dir + sep + relative name, so the
+        # archive name is a fixed-offset slice — no os.path.relpath
+        # normalization (or its hidden getcwd) per file
+        prefix_len = len(source_dir) + len(os.sep)
+        stack = [source_dir]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry.path, entry.path[prefix_len:]
+
+    def _create_zip_file(self, source_dir: str, zip_path: str,
+                         extra_files: Dict[str, str] = None,
+                         total_bytes: int = None):
+        """Create ZIP file from directory
+
+        Args:
+            source_dir: Directory whose files become archive entries
+            zip_path: Destination archive path
+            extra_files: In-memory entries appended after the tree
+            total_bytes: Tree size if the caller already knows it,
+                saving the preallocation estimate a stat pass
+
+        Returns:
+            int: Archive size in bytes, taken from the write position
+            so the caller never has to stat the finished file
+        """
+        entries = list(self._iter_project_files(source_dir))
+
+        fd = os.open(zip_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        estimated = 0
+        if hasattr(os, 'posix_fallocate'):
+            # Reserve one contiguous extent up front instead of growing
+            # the file write by write; deflated source trees land well
+            # under 40% of their input size
+            if total_bytes is None:
+                total_bytes = sum(os.stat(p).st_size for p, _ in entries)
+            estimated = int(total_bytes * 0.4)
+            if estimated > 0:
+                try:
+                    os.posix_fallocate(fd, 0, estimated)
+                except OSError:
+                    pass
+
+        fp = os.fdopen(fd, 'wb', buffering=1 << 20)
+        written = 0
+        with fp:
+            self._fill_zip(fp, entries, extra_files)
+            written = fp.tell()
+
+        # Release whatever the preallocation over-reserved
+        if estimated > written:
+            os.truncate(zip_path, written)
+        return written
+
+    def _fill_zip(self, fp, entries, extra_files: Dict[str, str] = None):
+        """Write all entries into an archive opened on fp"""
+        with zipfile.ZipFile(fp, 'w', zipfile.ZIP_DEFLATED,
+                             compresslevel=_ZIP_COMPRESSLEVEL,
+                             allowZip64=True) as zipf:
+            if len(entries) < _PARALLEL_ZIP_THRESHOLD:
+                for file_path, arcname in entries:
+                    zipf.write(file_path, arcname,
+                               compress_type=_compress_type(arcname))
+            else:
+                # Entries are independent deflate streams: compress
+                # them on a pool and append the finished bytes in order
+                workers = min(os.cpu_count() or 2, len(entries))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    for zinfo, data in pool.map(_deflate_entry, entries):
+                        self._append_precompressed(zipf, zinfo, data)
+
+            # Deployment artifacts go straight into the archive from
+            # memory — no disk round-trip through the project tree. A
+            # previously materialized copy in the tree wins over the
+            # injected one.
+            present = {arcname for _, arcname in entries}
+            for name, content in (extra_files or {}).items():
+                if name not in present:
+                    zipf.writestr(name, content,
+                                  compress_type=_compress_type(name))
+
+    @staticmethod
+    def _append_precompressed(zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo,
+                              data: bytes):
+        """Append an entry whose bytes were deflated off the archive
+
+        Writes the local header and compressed payload directly and
+        registers the entry so close() includes it in the central
+        directory, without zipfile re-running the compressor.
+        """
+        zinfo.header_offset = zipf.fp.tell()
+        # Match what zipfile itself does for a finished entry: emit the
+        # ZIP64 extra field whenever either size overflows the classic
+        # 32-bit header fields (FileHeader raises LargeZipFile otherwise)
+        zip64 = (zinfo.file_size > zipfile.ZIP64_LIMIT
+                 or zinfo.compress_size > zipfile.ZIP64_LIMIT)
+        zipf.fp.write(zinfo.FileHeader(zip64))
+        zipf.fp.write(data)
+        zipf.start_dir = zipf.fp.tell()
+        zipf.filelist.append(zinfo)
+        zipf.NameToInfo[zinfo.filename] = zinfo
+        zipf._didModify = True
     
     def _deploy_local(self, project_path: str) -> Dict[str, Any]:
         """Deploy project locally"""
         try:
-            # Create deployment script
-            deploy_script = self._create_local_deploy_script(project_path)
+            # Create deployment script; write_bytes opens, writes,
+            # and closes in one call with no text-mode layer
             script_path = os.path.join(project_path, 'deploy_local.sh')
-            
-            with open(script_path, 'w') as f:
-                f.write(deploy_script)
-            
+            Path(script_path).write_bytes(self._create_local_deploy_script(project_path))
+
             # Make script executable
             os.chmod(script_path, 0o755)
             
@@ -188,92 +721,40 @@ class ExportManager:
                 'message': f'Render deployment failed: {str(e)}'
             }
     
-    def _create_local_deploy_script(self, project_path: str) -> str:
+    def _create_local_deploy_script(self, project_path: str) -> bytes:
         """Create local deployment script"""
-        return f'''#!/bin/bash
-
-# API Weaver Local Deployment Script
-# Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-echo "🚀 Starting API Weaver Local Deployment..."
-
-# Check if Python is installed
-if ! command -v python3 &> /dev/null; then
-    echo "❌ Python3 is not installed. Please install Python3 first."
-    exit 1
-fi
+        # Deferred: only the local-deploy path ever needs datetime
+        from datetime import datetime
+        return _LOCAL_DEPLOY_TEMPLATE.format(
+            ts=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        ).encode('utf-8')
 
-# Check if pip is installed
-if ! command -v pip3 &> /dev/null; then
-    echo "❌ pip3 is not installed. Please install pip3 first."
-    exit 1
-fi
+    @staticmethod
+    def _write_artifact(job):
+        """Write one small pre-encoded deployment file through a raw fd
 
-# Install dependencies
-echo "📦 Installing dependencies..."
-pip3 install -r requirements.txt
-
-# Set environment variables
-export FLASK_APP=app.py
-export FLASK_ENV=development
-
-# Start the application
-echo "🌟 Starting API Weaver..."
-echo "📍 API will be available at: http://localhost:5000"
-echo "📚 Documentation: http://localhost:5000/docs"
-echo "🔍 Health Check: http://localhost:5000/health"
+        Skips the buffered-IO layer (and its fstat on close) — for
+        files this small the buffer is pure overhead.
+        """
+        path, data = job
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
 
-python3 app.py
-'''
-    
     def _create_heroku_files(self, project_path: str):
         """Create Heroku-specific deployment files"""
-        
-        # Create Procfile
-        procfile_content = "web: gunicorn app:app"
-        with open(os.path.join(project_path, 'Procfile'), 'w') as f:
-            f.write(procfile_content)
-        
-        # Create runtime.txt
-        runtime_content = "python-3.11.0"
-        with open(os.path.join(project_path, 'runtime.txt'), 'w') as f:
-            f.write(runtime_content)
-        
-        # Create app.json for Heroku Button
-        app_json = {
-            "name": "API Weaver Generated API",
-            "description": "Auto-generated API by API Weaver",
-            "repository": "https://github.com/api-weaver/generated-api",
-            "logo": "https://api-weaver.com/logo.png",
-            "keywords": ["api", "generated", "api-weaver"],
-            "success_url": "/",
-            "env": {
-                "FLASK_ENV": {
-                    "description": "Flask environment",
-                    "value": "production"
-                }
-            }
-        }
-        
-        import json
-        with open(os.path.join(project_path, 'app.json'), 'w') as f:
-            json.dump(app_json, f, indent=2)
-    
+        # Three tiny constant files; os.write releases the GIL, so a
+        # small pool overlaps the open/write/close syscalls
+        jobs = (
+            (os.path.join(project_path, 'Procfile'), _PROCFILE),
+            (os.path.join(project_path, 'runtime.txt'), _RUNTIME),
+            (os.path.join(project_path, 'app.json'), _HEROKU_APP_JSON),
+        )
+        with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+            list(pool.map(self._write_artifact, jobs))
+
     def _create_render_files(self, project_path: str):
         """Create Render-specific deployment files"""
-        
-        # Create render.yaml
-        render_yaml = f'''services:
-  - type: web
-    name: api-weaver-generated-api
-    env: python
-    buildCommand: pip install -r requirements.txt
-    startCommand: gunicorn app:app
-    envVars:
-      - key: FLASK_ENV
-        value: production
-    healthCheckPath: /health
-'''
-        
-        with open(os.path.join(project_path, 'render.yaml'), 'w') as f:
-            f.write(render_yaml)
+        Path(project_path, 'render.yaml').write_bytes(_RENDER_YAML)